@@ -0,0 +1,227 @@
+import bisect
+import logging
+
+from PyQt5.QtCore import QAbstractItemModel, QModelIndex, Qt
+
+logger = logging.getLogger(__name__)
+
+
+class ExclusionsModel(QAbstractItemModel):
+    """Two-level item model for detailed exclusions.
+
+    Top-level rows are the "Excluded Dirs" and "Excluded Files" categories;
+    their children are plain Python path lists that are handed to the view
+    in batches through canFetchMore/fetchMore instead of being materialized
+    as one item object per path.
+    """
+
+    CATEGORIES = (("Excluded Dirs", "Directory"), ("Excluded Files", "File"))
+    HEADERS = ("Type", "Path")
+    FETCH_BATCH_SIZE = 500
+
+    # internalId 0 marks a category row; children store category + 1
+    _CATEGORY_ID = 0
+
+    # Flag masks are combined once instead of on every flags() call
+    _CATEGORY_FLAGS = Qt.ItemFlags(Qt.ItemIsEnabled)
+    _TYPE_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable
+    _PATH_FLAGS = Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsEditable
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._dirs = []
+        self._files = []
+        self._loaded = [0, 0]
+        self._populated = False
+
+    def set_exclusions(self, excluded_dirs, excluded_files):
+        """Replace the model contents with sorted copies of the given paths"""
+        self.beginResetModel()
+        self._dirs = sorted(str(path) for path in excluded_dirs)
+        self._files = sorted(str(path) for path in excluded_files)
+        self._loaded = [0, 0]
+        self._populated = True
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all rows, including the category rows"""
+        self.beginResetModel()
+        self._dirs = []
+        self._files = []
+        self._loaded = [0, 0]
+        self._populated = False
+        self.endResetModel()
+
+    def add_path(self, category, path):
+        """Insert path into a category at its sorted position.
+
+        Rows are only announced to views when they land inside the range
+        already fetched; later positions are picked up by fetchMore.
+        """
+        if not self._populated:
+            self.beginResetModel()
+            self._populated = True
+            bisect.insort(self._paths(category), path)
+            self.endResetModel()
+            return
+
+        paths = self._paths(category)
+        row = bisect.bisect_left(paths, path)
+        if row <= self._loaded[category]:
+            self.beginInsertRows(self.category_index(category), row, row)
+            paths.insert(row, path)
+            self._loaded[category] += 1
+            self.endInsertRows()
+        else:
+            paths.insert(row, path)
+
+    def remove_path(self, category, path):
+        """Remove path from a category, returning whether it was present"""
+        paths = self._paths(category)
+        row = bisect.bisect_left(paths, path)
+        if row >= len(paths) or paths[row] != path:
+            return False
+        if row < self._loaded[category]:
+            self.beginRemoveRows(self.category_index(category), row, row)
+            del paths[row]
+            self._loaded[category] -= 1
+            self.endRemoveRows()
+        else:
+            del paths[row]
+        return True
+
+    def excluded_dirs(self):
+        """Return a snapshot of all excluded directories, fetched or not"""
+        return list(self._dirs)
+
+    def excluded_files(self):
+        """Return a snapshot of all excluded files, fetched or not"""
+        return list(self._files)
+
+    def _paths(self, category):
+        return self._dirs if category == 0 else self._files
+
+    def category_index(self, category):
+        """Return the index of the category row ("Excluded Dirs" is 0)"""
+        return self.index(category, 0)
+
+    def path_at(self, index):
+        """Return (category, path) for a child index, or None for category rows"""
+        if not index.isValid() or index.internalId() == self._CATEGORY_ID:
+            return None
+        category = index.internalId() - 1
+        return category, self._paths(category)[index.row()]
+
+    # QAbstractItemModel interface
+
+    def index(self, row, column, parent=QModelIndex()):
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+        if not parent.isValid():
+            return self.createIndex(row, column, self._CATEGORY_ID)
+        return self.createIndex(row, column, parent.row() + 1)
+
+    def parent(self, index):
+        if not index.isValid() or index.internalId() == self._CATEGORY_ID:
+            return QModelIndex()
+        return self.createIndex(index.internalId() - 1, 0, self._CATEGORY_ID)
+
+    def rowCount(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return len(self.CATEGORIES) if self._populated else 0
+        if parent.column() != 0 or parent.internalId() != self._CATEGORY_ID:
+            return 0
+        return self._loaded[parent.row()]
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.HEADERS)
+
+    def hasChildren(self, parent=QModelIndex()):
+        if not parent.isValid():
+            return self._populated
+        if parent.column() != 0 or parent.internalId() != self._CATEGORY_ID:
+            return False
+        return bool(self._paths(parent.row()))
+
+    def canFetchMore(self, parent):
+        if not parent.isValid() or parent.internalId() != self._CATEGORY_ID:
+            return False
+        category = parent.row()
+        return self._loaded[category] < len(self._paths(category))
+
+    def fetchMore(self, parent):
+        if not self.canFetchMore(parent):
+            return
+        category = parent.row()
+        first = self._loaded[category]
+        last = min(first + self.FETCH_BATCH_SIZE, len(self._paths(category))) - 1
+        self.beginInsertRows(parent, first, last)
+        self._loaded[category] = last + 1
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or role not in (Qt.DisplayRole, Qt.EditRole):
+            return None
+        if index.internalId() == self._CATEGORY_ID:
+            return self.CATEGORIES[index.row()][0] if index.column() == 0 else None
+        category = index.internalId() - 1
+        if index.column() == 0:
+            return self.CATEGORIES[category][1]
+        return self._paths(category)[index.row()]
+
+    def setData(self, index, value, role=Qt.EditRole):
+        if (
+            role != Qt.EditRole
+            or not index.isValid()
+            or index.internalId() == self._CATEGORY_ID
+            or index.column() != 1
+        ):
+            return False
+        value = str(value).strip()
+        if not value:
+            return False
+
+        category = index.internalId() - 1
+        paths = self._paths(category)
+        row = index.row()
+        if paths[row] == value:
+            return True
+        position = bisect.bisect_left(paths, value)
+        if position < len(paths) and paths[position] == value:
+            return False
+
+        # add_path/remove_path bisect, so the edited row moves to keep order;
+        # target is its position once the old value is gone
+        target = position - 1 if position > row else position
+        if target == row:
+            paths[row] = value
+            self.dataChanged.emit(index, index, [role])
+            return True
+
+        parent = self.category_index(category)
+        if target < self._loaded[category]:
+            destination = target + 1 if target > row else target
+            self.beginMoveRows(parent, row, row, parent, destination)
+            del paths[row]
+            paths.insert(target, value)
+            self.endMoveRows()
+        else:
+            # Lands past the fetched rows; fetchMore will announce it
+            self.beginRemoveRows(parent, row, row)
+            del paths[row]
+            self._loaded[category] -= 1
+            self.endRemoveRows()
+            paths.insert(target, value)
+        return True
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if index.internalId() == self._CATEGORY_ID:
+            return self._CATEGORY_FLAGS
+        return self._PATH_FLAGS if index.column() == 1 else self._TYPE_FLAGS
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
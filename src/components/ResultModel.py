@@ -0,0 +1,62 @@
+import logging
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+logger = logging.getLogger(__name__)
+
+
+class ResultModel(QAbstractTableModel):
+    """Table model over the analyzer's flat structure.
+
+    The result dicts are split into one list per column when loaded, so
+    only the strings themselves are kept alive and cells are read by index
+    without per-row dict or item objects.
+    """
+
+    COLUMNS = ("path", "description")
+    HEADERS = ("Path", "Description")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._paths = []
+        self._descriptions = []
+
+    def set_rows(self, rows):
+        """Replace the model contents with the given result rows"""
+        rows = rows if rows is not None else []
+        self.beginResetModel()
+        self._paths = [row["path"] for row in rows]
+        self._descriptions = [row["description"] for row in rows]
+        self.endResetModel()
+
+    def clear(self):
+        """Remove all rows"""
+        self.set_rows([])
+
+    def paths(self):
+        """Return the path column"""
+        return self._paths
+
+    def descriptions(self):
+        """Return the description column"""
+        return self._descriptions
+
+    # QAbstractTableModel interface
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._paths)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index, role=Qt.DisplayRole):
+        # Rows have a fixed height, so the tooltip carries elided text
+        if role not in (Qt.DisplayRole, Qt.ToolTipRole) or not index.isValid():
+            return None
+        column = self._paths if index.column() == 0 else self._descriptions
+        return column[index.row()]
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if orientation == Qt.Horizontal and role == Qt.DisplayRole:
+            return self.HEADERS[section]
+        return None
@@ -2,7 +2,7 @@ import logging
 import os
 
 from PyQt5.QtCore import QSize, Qt
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QHBoxLayout,
     QHeaderView,
@@ -17,7 +17,7 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from utilities.resource_path import get_resource_path
+from utilities.icons import get_app_icon, get_icon
 from utilities.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
@@ -40,11 +40,11 @@ class AutoExcludeUI(QMainWindow):
         self.project_context = project_context
         self.theme_manager = theme_manager or ThemeManager.getInstance()
 
-        self.folder_icon = QIcon(get_resource_path("assets/images/folder_icon.png"))
-        self.file_icon = QIcon(get_resource_path("assets/images/file_icon.png"))
+        self.folder_icon = get_icon("assets/images/folder_icon.png")
+        self.file_icon = get_icon("assets/images/file_icon.png")
 
         self.setWindowTitle("Auto-Exclude Recommendations")
-        self.setWindowIcon(QIcon(get_resource_path("assets/images/GynTree_logo.ico")))
+        self.setWindowIcon(get_app_icon())
 
         self.init_ui()
 
@@ -1,8 +1,8 @@
 import logging
 import os
 
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon, QPixmap
+from PyQt5.QtCore import Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QFont, QPixmap
 from PyQt5.QtWidgets import (
     QHBoxLayout,
     QLabel,
@@ -21,6 +21,7 @@ from components.UI.ExclusionsManagerUI import ExclusionsManagerUI
 from components.UI.ProjectManagementUI import ProjectManagementUI
 from components.UI.ProjectUI import ProjectUI
 from components.UI.ResultUI import ResultUI
+from utilities.icons import get_app_icon
 from utilities.resource_path import get_resource_path
 from utilities.theme_manager import ThemeManager
 
@@ -49,8 +50,7 @@ class DashboardUI(QMainWindow):
     def initUI(self):
         """Initialize the UI components"""
         self.setWindowTitle("GynTree Dashboard")
-        icon_path = get_resource_path("assets/images/GynTree_logo.ico")
-        self.setWindowIcon(QIcon(icon_path))
+        self.setWindowIcon(get_app_icon())
 
         # Create central widget and main layout
         central_widget = QWidget(self)
@@ -119,7 +119,8 @@ class DashboardUI(QMainWindow):
         ]:
             main_layout.addWidget(btn)
 
-        # Connect button signals
+        # Connect button signals. Controller errors raised here are reported by
+        # ErrorHandler through sys.excepthook
         self.projects_btn.clicked.connect(self.show_project_ui)
         self.manage_projects_btn.clicked.connect(self.controller.manage_projects)
         self.manage_exclusions_btn.clicked.connect(self.controller.manage_exclusions)
@@ -168,15 +169,23 @@ class DashboardUI(QMainWindow):
 
     def show_project_ui(self):
         """Show the unified project UI for creating or loading projects"""
-        if self.project_ui:
-            self.project_ui.close()
-            self.project_ui = None
-
-        self.project_ui = ProjectUI(self.controller)
-        self.project_ui.project_created.connect(self.on_project_created)
-        self.project_ui.project_loaded.connect(self.on_project_loaded)
-        self.ui_components.append(self.project_ui)
+        if self.project_ui is None:
+            self.project_ui = ProjectUI(self.controller)
+            # Both sides live on the GUI thread, so skip the connection-type check
+            self.project_ui.project_created.connect(
+                self.on_project_created, Qt.DirectConnection
+            )
+            self.project_ui.project_loaded.connect(
+                self.on_project_loaded, Qt.DirectConnection
+            )
+            self.ui_components.append(self.project_ui)
+        else:
+            # Reuse the hidden window, dropping whatever the last use left behind
+            self.project_ui.reset_inputs()
+            self.project_ui.refresh_project_list()
         self.project_ui.show()
+        self.project_ui.raise_()
+        self.project_ui.activateWindow()
         return self.project_ui
 
     def show_project_management(self):
@@ -186,12 +195,14 @@ class DashboardUI(QMainWindow):
         management_ui.show()
         return management_ui
 
+    @pyqtSlot(object)
     def on_project_created(self, project):
         """Handle project created event"""
         logger.info(f"Project creation signal received: {project.name}")
         self.controller.on_project_created(project)
         self.update_project_info(project)
 
+    @pyqtSlot(object)
     def on_project_loaded(self, project):
         """Handle project loaded event"""
         self.update_project_info(project)
@@ -315,7 +326,10 @@ class DashboardUI(QMainWindow):
         """Handle window close event and cleanup"""
         for component in self.ui_components:
             try:
-                if component and hasattr(component, "close"):
+                if component is self.project_ui:
+                    # ProjectUI only hides on a plain close
+                    component.shutdown()
+                elif component and hasattr(component, "close"):
                     component.close()
             except Exception as e:
                 logger.debug(f"Non-critical UI component cleanup warning: {e}")
@@ -1,4 +1,6 @@
 import logging
+from collections import deque
+from operator import itemgetter
 
 from PyQt5.QtCore import QSize, Qt, pyqtSlot
 from PyQt5.QtGui import QFont, QIcon
@@ -15,11 +17,14 @@ from PyQt5.QtWidgets import (
 )
 
 from components.TreeExporter import TreeExporter
-from utilities.resource_path import get_resource_path
+from utilities.icons import get_icon
 from utilities.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
+# Fetch both per-node fields in a single C-level call
+_node_fields = itemgetter("name", "type")
+
 
 class DirectoryTreeUI(QWidget):
     def __init__(self, controller, theme_manager: ThemeManager):
@@ -29,6 +34,7 @@ class DirectoryTreeUI(QWidget):
         self.directory_structure = None
         self.folder_icon = None
         self.file_icon = None
+        self._icons_ok = False
         self.tree_widget = None
         self.tree_exporter = None
         self._load_icons()
@@ -38,12 +44,13 @@ class DirectoryTreeUI(QWidget):
     def _load_icons(self):
         """Safely load icons with error handling"""
         try:
-            self.folder_icon = QIcon(get_resource_path("assets/images/folder_icon.png"))
-            self.file_icon = QIcon(get_resource_path("assets/images/file_icon.png"))
+            self.folder_icon = get_icon("assets/images/folder_icon.png")
+            self.file_icon = get_icon("assets/images/file_icon.png")
         except Exception as e:
             logger.error(f"Failed to load icons: {str(e)}")
             self.folder_icon = QIcon()
             self.file_icon = QIcon()
+        self._icons_ok = not self.folder_icon.isNull() and not self.file_icon.isNull()
 
     def init_ui(self):
         """Initialize the user interface with proper error handling"""
@@ -159,32 +166,52 @@ class DirectoryTreeUI(QWidget):
         """Update the tree with proper error handling"""
         try:
             self.directory_structure = directory_structure
-            self.tree_widget.clear()
-            if directory_structure:
-                self._populate_tree(
-                    self.tree_widget.invisibleRootItem(), self.directory_structure
-                )
-                self.tree_widget.expandAll()
+            # Suspend repaints and row shading while the tree is rebuilt
+            self.tree_widget.setUpdatesEnabled(False)
+            self.tree_widget.setAlternatingRowColors(False)
+            self.tree_widget.blockSignals(True)
+            try:
+                self.tree_widget.clear()
+                if directory_structure:
+                    self._populate_tree(
+                        self.tree_widget.invisibleRootItem(), self.directory_structure
+                    )
+                    self.tree_widget.expandAll()
+            finally:
+                self.tree_widget.blockSignals(False)
+                self.tree_widget.setAlternatingRowColors(True)
+                self.tree_widget.setUpdatesEnabled(True)
         except Exception as e:
             logger.error(f"Error updating tree: {str(e)}")
             QMessageBox.warning(self, "Update Error", "Failed to update directory tree")
 
     def _populate_tree(self, parent, data):
-        """Populate tree with proper error handling"""
-        try:
-            item = QTreeWidgetItem(parent)
-            item.setText(0, data["name"])
-
-            # Set icon based on type with null check
-            icon = self.folder_icon if data["type"] == "directory" else self.file_icon
-            if not icon.isNull():
-                item.setIcon(0, icon)
-
-            if "children" in data and isinstance(data["children"], list):
-                for child in data["children"]:
-                    self._populate_tree(item, child)
-        except Exception as e:
-            logger.error(f"Error populating tree item: {str(e)}")
+        """Populate tree iteratively so deep structures avoid recursion limits"""
+        icons_ok = self._icons_ok
+        folder_icon = self.folder_icon
+        file_icon = self.file_icon
+        stack = deque([(parent, data)])
+        while stack:
+            parent_item, node = stack.pop()
+            try:
+                name, node_type = _node_fields(node)
+                # Attached only once built, so a malformed node leaves no blank row
+                item = QTreeWidgetItem([name])
+
+                # Icon validity is checked once at load time
+                if icons_ok:
+                    item.setIcon(
+                        0, folder_icon if node_type == "directory" else file_icon
+                    )
+                parent_item.addChild(item)
+
+                children = node.get("children")
+            except Exception as e:
+                logger.error(f"Error populating tree item: {str(e)}")
+                continue
+            if isinstance(children, list):
+                for child in reversed(children):
+                    stack.append((item, child))
 
     def apply_theme(self):
         """Apply theme with error handling"""
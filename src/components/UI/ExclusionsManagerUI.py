@@ -1,8 +1,9 @@
+import bisect
 import logging
 import os
 
-from PyQt5.QtCore import Qt
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import QObject, QRunnable, Qt, QThreadPool, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QFileDialog,
     QGroupBox,
@@ -12,17 +13,50 @@ from PyQt5.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSplitter,
+    QTreeView,
     QTreeWidget,
     QTreeWidgetItem,
     QVBoxLayout,
     QWidget,
 )
 
-from utilities.resource_path import get_resource_path
+from components.ExclusionsModel import ExclusionsModel
+from utilities.icons import get_app_icon
 from utilities.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
+_TITLE_FONT = QFont("Arial", 20, QFont.Bold)
+
+# Root exclusions are shown read-only: enabled, but not selectable or editable
+_ROOT_ITEM_FLAGS = Qt.ItemFlags(Qt.ItemIsEnabled)
+
+
+class RelPathSignals(QObject):
+    finished = pyqtSignal(str, str)  # exclusion key, relative path
+    error = pyqtSignal(str)
+
+
+class RelPathWorker(QRunnable):
+    """Resolve a selected path against the project root off the UI thread"""
+
+    def __init__(self, key, path, start_directory):
+        super().__init__()
+        self.key = key
+        self.path = path
+        self.start_directory = start_directory
+        # Unparented and owned by this request, so it outlives a closed window;
+        # Qt drops the connections when the receiving window is destroyed
+        self.signals = RelPathSignals()
+
+    def run(self):
+        try:
+            relative_path = os.path.relpath(self.path, self.start_directory)
+        except ValueError as e:
+            self.signals.error.emit(str(e))
+            return
+        self.signals.finished.emit(self.key, relative_path)
+
 
 class ExclusionsManagerUI(QWidget):
     def __init__(self, controller, theme_manager: ThemeManager, settings_manager):
@@ -30,23 +64,56 @@ class ExclusionsManagerUI(QWidget):
         self.controller = controller
         self.theme_manager = theme_manager
         self.settings_manager = settings_manager
-        self.exclusion_tree = None
-        self.root_tree = None
+        self._exclusion_tree = None
+        self._exclusion_model = None
+        self._root_tree = None
+        self._root_exclusions = []
+        self._exclusions_cache = None
+        self._root_prefixes = None
+        self._exclusions_signature = None
+        self._start_directory = None
         self._skip_show_event = False  # Add flag for testing
+        self._ui_built = False
 
         self.setWindowTitle("Exclusions Manager")
-        self.setWindowIcon(QIcon(get_resource_path("assets/images/GynTree_logo.ico")))
+        self.setWindowIcon(get_app_icon())
 
-        self.init_ui()
+        # Widgets are built and themed on first show, see _ensure_ui
         self.theme_manager.themeChanged.connect(self.apply_theme)
 
+    def _ensure_ui(self):
+        """Build the widgets once, the first time they are needed"""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+            # Style the finished widget tree in a single pass
+            self.apply_theme()
+
+    # The widgets are built lazily, but callers may reach them before the
+    # first show; accessing any of them builds the UI
+
+    @property
+    def exclusion_tree(self):
+        self._ensure_ui()
+        return self._exclusion_tree
+
+    @property
+    def exclusion_model(self):
+        self._ensure_ui()
+        return self._exclusion_model
+
+    @property
+    def root_tree(self):
+        self._ensure_ui()
+        return self._root_tree
+
     def init_ui(self):
         layout = QVBoxLayout()
         layout.setContentsMargins(20, 20, 20, 20)
         layout.setSpacing(15)
 
         title = QLabel("Manage Exclusions")
-        title.setFont(QFont("Arial", 20, QFont.Bold))
+        title.setFont(_TITLE_FONT)
         title.setAlignment(Qt.AlignCenter)
         layout.addWidget(title)
 
@@ -56,8 +123,10 @@ class ExclusionsManagerUI(QWidget):
         # Root exclusions (read-only)
         root_group = QGroupBox("Root Exclusions (Non-editable)")
         root_layout = QVBoxLayout()
-        self.root_tree = QTreeWidget()
+        self._root_tree = QTreeWidget()
         self.root_tree.setHeaderLabels(["Excluded Paths"])
+        self.root_tree.setUniformRowHeights(True)
+        self.root_tree.setAnimated(False)
         self.root_tree.header().setSectionResizeMode(0, QHeaderView.Stretch)
         root_layout.addWidget(self.root_tree)
         root_group.setLayout(root_layout)
@@ -66,8 +135,16 @@ class ExclusionsManagerUI(QWidget):
         # Detailed exclusions (editable)
         detailed_group = QGroupBox("Detailed Exclusions")
         detailed_layout = QVBoxLayout()
-        self.exclusion_tree = QTreeWidget()
-        self.exclusion_tree.setHeaderLabels(["Type", "Path"])
+        self._exclusion_model = ExclusionsModel(self)
+        # In-place edits leave the model ahead of settings until saved
+        self.exclusion_model.dataChanged.connect(self._reset_exclusions_signature)
+        self._exclusion_tree = QTreeView()
+        self.exclusion_tree.setModel(self.exclusion_model)
+        self.exclusion_tree.setUniformRowHeights(True)
+        self.exclusion_tree.setAnimated(False)
+        self.exclusion_tree.verticalScrollBar().valueChanged.connect(
+            self._fetch_visible_exclusions
+        )
         self.exclusion_tree.header().setSectionResizeMode(
             0, QHeaderView.ResizeToContents
         )
@@ -98,21 +175,18 @@ class ExclusionsManagerUI(QWidget):
         add_file_button.clicked.connect(self.add_file)
         remove_button.clicked.connect(self.remove_selected)
 
-        self.apply_theme()
-
     def showEvent(self, event):
+        self._ensure_ui()
         super().showEvent(event)
         if not self._skip_show_event:
             self.load_project_data()
 
     def load_project_data(self):
-        if (
-            self.controller.project_controller.project_context
-            and self.controller.project_controller.project_context.is_initialized
-        ):
-            self.settings_manager = (
-                self.controller.project_controller.project_context.settings_manager
-            )
+        project_context = self.controller.project_controller.project_context
+        if project_context and project_context.is_initialized:
+            self.settings_manager = project_context.settings_manager
+            self._start_directory = project_context.project.start_directory
+            self._invalidate_exclusions()
             self.populate_exclusion_tree()
             self.populate_root_exclusions()
         else:
@@ -122,14 +196,72 @@ class ExclusionsManagerUI(QWidget):
                 "No project is currently loaded or initialized. Please load or create a project first.",
             )
 
+    def _get_exclusions(self):
+        """Return exclusions as sets, fetching them from settings only once"""
+        if self._exclusions_cache is None:
+            exclusions = self.settings_manager.get_all_exclusions()
+            self._exclusions_cache = {
+                key: set(exclusions.get(key, []))
+                for key in ("root_exclusions", "excluded_dirs", "excluded_files")
+            }
+        return self._exclusions_cache
+
+    def _get_start_directory(self):
+        """Return the project start directory, looking it up only once"""
+        if self._start_directory is None:
+            self._start_directory = (
+                self.controller.project_controller.project_context.project.start_directory
+            )
+        return self._start_directory
+
+    def _invalidate_exclusions(self):
+        self._exclusions_cache = None
+        self._root_prefixes = None
+
+    def _is_under_root_exclusion(self, path):
+        """Check whether path starts with any root exclusion.
+
+        Root exclusions are kept sorted with entries that extend another
+        entry dropped, so the only candidate prefix is the greatest entry
+        not after path, found with a single bisect.
+        """
+        if self._root_prefixes is None:
+            prefixes = []
+            for root in sorted(self._get_exclusions()["root_exclusions"]):
+                if not prefixes or not root.startswith(prefixes[-1]):
+                    prefixes.append(root)
+            self._root_prefixes = prefixes
+
+        index = bisect.bisect_right(self._root_prefixes, path) - 1
+        return index >= 0 and path.startswith(self._root_prefixes[index])
+
     def populate_root_exclusions(self):
-        self.root_tree.clear()
-        if self.settings_manager:
-            root_exclusions = self.settings_manager.get_root_exclusions()
-            for path in sorted(root_exclusions):
-                item = QTreeWidgetItem(self.root_tree, [path])
-                item.setFlags(item.flags() & ~Qt.ItemIsSelectable & ~Qt.ItemIsEditable)
-            self.root_tree.expandAll()
+        root_exclusions = (
+            sorted(self.settings_manager.get_root_exclusions())
+            if self.settings_manager
+            else []
+        )
+        if (
+            root_exclusions == self._root_exclusions
+            and self.root_tree.topLevelItemCount() == len(root_exclusions)
+        ):
+            return
+
+        self.root_tree.setUpdatesEnabled(False)
+        self.root_tree.blockSignals(True)
+        try:
+            self.root_tree.clear()
+            self._root_exclusions = root_exclusions
+            items = []
+            for path in root_exclusions:
+                item = QTreeWidgetItem([path])
+                item.setFlags(_ROOT_ITEM_FLAGS)
+                items.append(item)
+            self.root_tree.addTopLevelItems(items)
+        finally:
+            self.root_tree.blockSignals(False)
+            self.root_tree.setUpdatesEnabled(True)
+        self.root_tree.expandAll()
 
     def add_directory(self):
         if not self.settings_manager:
@@ -140,29 +272,7 @@ class ExclusionsManagerUI(QWidget):
             self, "Select Directory to Exclude"
         )
         if directory:
-            relative_directory = os.path.relpath(
-                directory,
-                self.controller.project_controller.project_context.project.start_directory,
-            )
-            exclusions = self.settings_manager.get_all_exclusions()
-            excluded_dirs = set(exclusions.get("excluded_dirs", []))
-            root_exclusions = set(exclusions.get("root_exclusions", []))
-
-            if (
-                relative_directory not in excluded_dirs
-                and relative_directory not in root_exclusions
-            ):
-                excluded_dirs.add(relative_directory)
-                self.settings_manager.update_settings(
-                    {"excluded_dirs": list(excluded_dirs)}
-                )
-                self.populate_exclusion_tree()
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Duplicate Entry",
-                    f"The directory '{relative_directory}' is already excluded.",
-                )
+            self._resolve_relative_path("excluded_dirs", directory)
 
     def add_file(self):
         if not self.settings_manager:
@@ -171,123 +281,171 @@ class ExclusionsManagerUI(QWidget):
 
         file, _ = QFileDialog.getOpenFileName(self, "Select File to Exclude")
         if file:
-            relative_file = os.path.relpath(
-                file,
-                self.controller.project_controller.project_context.project.start_directory,
+            self._resolve_relative_path("excluded_files", file)
+
+    def _resolve_relative_path(self, key, path):
+        """Queue relative path resolution; the result arrives in _on_relpath_ready"""
+        worker = RelPathWorker(key, path, self._get_start_directory())
+        worker.signals.finished.connect(self._on_relpath_ready, Qt.QueuedConnection)
+        worker.signals.error.connect(self._on_relpath_error, Qt.QueuedConnection)
+        QThreadPool.globalInstance().start(worker)
+
+    @pyqtSlot(str, str)
+    def _on_relpath_ready(self, key, relative_path):
+        if not self.settings_manager:
+            return
+        if key == "excluded_dirs":
+            self._add_excluded_directory(relative_path)
+        else:
+            self._add_excluded_file(relative_path)
+
+    @pyqtSlot(str)
+    def _on_relpath_error(self, error):
+        logger.error(f"Failed to resolve exclusion path: {error}")
+        QMessageBox.warning(
+            self,
+            "Invalid Path",
+            "The selected path cannot be made relative to the project directory.",
+        )
+
+    def _add_excluded_directory(self, relative_directory):
+        exclusions = self._get_exclusions()
+        excluded_dirs = exclusions["excluded_dirs"]
+        root_exclusions = exclusions["root_exclusions"]
+
+        if (
+            relative_directory not in excluded_dirs
+            and relative_directory not in root_exclusions
+        ):
+            self.settings_manager.add_excluded_dir(relative_directory)
+            excluded_dirs.add(relative_directory)
+            self.exclusion_model.add_path(0, relative_directory)
+        else:
+            QMessageBox.warning(
+                self,
+                "Duplicate Entry",
+                f"The directory '{relative_directory}' is already excluded.",
+            )
+
+    def _add_excluded_file(self, relative_file):
+        excluded_files = self._get_exclusions()["excluded_files"]
+
+        if relative_file not in excluded_files and not self._is_under_root_exclusion(
+            relative_file
+        ):
+            self.settings_manager.add_excluded_file(relative_file)
+            excluded_files.add(relative_file)
+            self.exclusion_model.add_path(1, relative_file)
+        else:
+            QMessageBox.warning(
+                self,
+                "Duplicate Entry",
+                f"The file '{relative_file}' is already excluded or within a root exclusion.",
             )
-            exclusions = self.settings_manager.get_all_exclusions()
-            excluded_files = set(exclusions.get("excluded_files", []))
-            root_exclusions = set(exclusions.get("root_exclusions", []))
-
-            if relative_file not in excluded_files and not any(
-                relative_file.startswith(root_dir) for root_dir in root_exclusions
-            ):
-                excluded_files.add(relative_file)
-                self.settings_manager.update_settings(
-                    {"excluded_files": list(excluded_files)}
-                )
-                self.populate_exclusion_tree()
-            else:
-                QMessageBox.warning(
-                    self,
-                    "Duplicate Entry",
-                    f"The file '{relative_file}' is already excluded or within a root exclusion.",
-                )
 
     def remove_selected(self):
         if not self.settings_manager:
             QMessageBox.warning(self, "No Project", "No project is currently loaded.")
             return
 
-        selected_items = self.exclusion_tree.selectedItems()
-        if not selected_items:
+        selected_rows = self.exclusion_tree.selectionModel().selectedRows()
+        if not selected_rows:
             QMessageBox.information(
                 self, "No Selection", "Please select an exclusion to remove."
             )
             return
 
-        exclusions = self.settings_manager.get_all_exclusions()
-        excluded_dirs = set(exclusions.get("excluded_dirs", []))
-        excluded_files = set(exclusions.get("excluded_files", []))
-        updated = False
-
-        for item in selected_items:
-            parent = item.parent()
-            if parent:
-                path = item.text(1)
-                category = parent.text(0)
-                if category == "Excluded Dirs" and path in excluded_dirs:
-                    excluded_dirs.remove(path)
-                    updated = True
-                elif category == "Excluded Files" and path in excluded_files:
-                    excluded_files.remove(path)
-                    updated = True
-
-        if updated:
-            self.settings_manager.update_settings(
-                {
-                    "excluded_dirs": list(excluded_dirs),
-                    "excluded_files": list(excluded_files),
-                }
-            )
-            self.populate_exclusion_tree()
+        exclusions = self._get_exclusions()
+        excluded_dirs = exclusions["excluded_dirs"]
+        excluded_files = exclusions["excluded_files"]
+        removed = []
+
+        for index in selected_rows:
+            entry = self.exclusion_model.path_at(index)
+            if entry:
+                category, path = entry
+                if category == 0 and path in excluded_dirs:
+                    removed.append(entry)
+                elif category == 1 and path in excluded_files:
+                    removed.append(entry)
+
+        # Remove in place and write settings once for the whole selection
+        with self.settings_manager.batch():
+            for category, path in removed:
+                if category == 0:
+                    self.settings_manager.remove_excluded_dir(path)
+                    excluded_dirs.discard(path)
+                else:
+                    self.settings_manager.remove_excluded_file(path)
+                    excluded_files.discard(path)
+                self.exclusion_model.remove_path(category, path)
 
     def populate_exclusion_tree(self):
-        self.exclusion_tree.clear()
-        if self.settings_manager:
-            exclusions = self.settings_manager.get_all_exclusions()
-
-            dirs_item = QTreeWidgetItem(self.exclusion_tree, ["Excluded Dirs"])
-            dirs_item.setFlags(dirs_item.flags() & ~Qt.ItemIsSelectable)
-            for directory in sorted(exclusions.get("excluded_dirs", [])):
-                item = QTreeWidgetItem(dirs_item, ["Directory", str(directory)])
-                item.setFlags(item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEditable)
+        if not self.settings_manager:
+            self.exclusion_model.clear()
+            self._exclusions_signature = None
+            return
 
-            files_item = QTreeWidgetItem(self.exclusion_tree, ["Excluded Files"])
-            files_item.setFlags(files_item.flags() & ~Qt.ItemIsSelectable)
-            for file in sorted(exclusions.get("excluded_files", [])):
-                item = QTreeWidgetItem(files_item, ["File", str(file)])
-                item.setFlags(item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEditable)
+        exclusions = self._get_exclusions()
+        signature = (
+            frozenset(exclusions["excluded_dirs"]),
+            frozenset(exclusions["excluded_files"]),
+        )
+        if signature == self._exclusions_signature:
+            # Same content as the last rebuild, e.g. on a hide/show cycle
+            return
 
-            self.exclusion_tree.expandAll()
+        self.exclusion_tree.setUpdatesEnabled(False)
+        try:
+            self.exclusion_model.set_exclusions(*signature)
+        finally:
+            self.exclusion_tree.setUpdatesEnabled(True)
+        self._exclusions_signature = signature
+        self.exclusion_tree.expandAll()
+
+    def _reset_exclusions_signature(self, *args):
+        self._exclusions_signature = None
+
+    def _fetch_visible_exclusions(self, *args):
+        """Fetch exclusion rows until each expanded category fills the viewport"""
+        # Qt only fetches for the last visible parent, so an expanded category
+        # scrolled into view above "Excluded Files" is topped up here
+        if not self.exclusion_tree.isVisible():
+            return
+        model = self.exclusion_model
+        viewport_bottom = self.exclusion_tree.viewport().rect().bottom()
+        for category in range(model.rowCount()):
+            parent = model.category_index(category)
+            if not self.exclusion_tree.isExpanded(parent):
+                continue
+            while model.canFetchMore(parent):
+                loaded = model.rowCount(parent)
+                last_index = model.index(loaded - 1, 0, parent) if loaded else parent
+                rect = self.exclusion_tree.visualRect(last_index)
+                if not rect.isValid() or rect.top() > viewport_bottom:
+                    break
+                model.fetchMore(parent)
 
     def save_and_exit(self):
         if self.settings_manager:
             try:
-                # Get root exclusions
-                root_exclusions = []
-                for i in range(self.root_tree.topLevelItemCount()):
-                    item = self.root_tree.topLevelItem(i)
-                    if item:
-                        root_exclusions.append(item.text(0))
-
-                # Get excluded directories
-                excluded_dirs = []
-                dirs_item = self.exclusion_tree.topLevelItem(0)
-                if dirs_item:
-                    for i in range(dirs_item.childCount()):
-                        child = dirs_item.child(i)
-                        if child:
-                            excluded_dirs.append(child.text(1))
-
-                # Get excluded files
-                excluded_files = []
-                files_item = self.exclusion_tree.topLevelItem(1)
-                if files_item:
-                    for i in range(files_item.childCount()):
-                        child = files_item.child(i)
-                        if child:
-                            excluded_files.append(child.text(1))
-
-                # Update settings
-                self.settings_manager.update_settings(
-                    {
-                        "root_exclusions": root_exclusions,
-                        "excluded_dirs": excluded_dirs,
-                        "excluded_files": excluded_files,
-                    }
-                )
-                self.settings_manager.save_settings()
+                # Snapshot the Python-side lists instead of walking the views;
+                # the model holds every path, including rows not yet fetched
+                root_exclusions = list(self._root_exclusions)
+                excluded_dirs = self.exclusion_model.excluded_dirs()
+                excluded_files = self.exclusion_model.excluded_files()
+
+                # Update and save settings with a single write
+                with self.settings_manager.batch():
+                    self.settings_manager.update_settings(
+                        {
+                            "root_exclusions": root_exclusions,
+                            "excluded_dirs": excluded_dirs,
+                            "excluded_files": excluded_files,
+                        }
+                    )
+                    self._invalidate_exclusions()
+                    self.settings_manager.save_settings()
                 self.close()
             except Exception as e:
                 logger.error(f"Error saving exclusions: {str(e)}")
@@ -303,4 +461,5 @@ class ExclusionsManagerUI(QWidget):
         self.theme_manager.apply_theme(self)
 
     def closeEvent(self, event):
+        self._start_directory = None
         super().closeEvent(event)
@@ -1,13 +1,12 @@
 import logging
 
 from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
     QFrame,
     QHBoxLayout,
     QLabel,
     QListWidget,
-    QListWidgetItem,
     QMainWindow,
     QMessageBox,
     QPushButton,
@@ -17,11 +16,15 @@ from PyQt5.QtWidgets import (
     QWidget,
 )
 
-from utilities.resource_path import get_resource_path
+from utilities.icons import get_app_icon
 from utilities.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
+_HEADER_FONT = QFont("Arial", 24, QFont.Bold)
+_BODY_FONT = QFont("Arial", 12)
+_LIST_FONT = QFont("Arial", 11)
+
 
 class ProjectManagementUI(QMainWindow):
     project_deleted = pyqtSignal(str)  # Emits project name when deleted
@@ -32,22 +35,25 @@ class ProjectManagementUI(QMainWindow):
         self.theme_manager = theme_manager or ThemeManager.getInstance()
         self.project_list = None
         self.delete_button = None
+        self._ui_built = False
 
-        # Initialize UI first
-        self.init_ui()
+        self.setWindowTitle("Project Management")
+        self.setWindowIcon(get_app_icon())
 
-        # Then connect theme changes and apply theme
+        # Widgets are built and themed on first show, see _ensure_ui
         self.theme_manager.themeChanged.connect(self.apply_theme)
-        self.apply_theme()
+
+    def _ensure_ui(self):
+        """Build the widgets once, the first time they are needed."""
+        if not self._ui_built:
+            self._ui_built = True
+            self.init_ui()
+            # Style the finished widget tree in a single pass
+            self.apply_theme()
 
     def init_ui(self):
         """Initialize the user interface."""
         try:
-            self.setWindowTitle("Project Management")
-            self.setWindowIcon(
-                QIcon(get_resource_path("assets/images/GynTree_logo.ico"))
-            )
-
             central_widget = QWidget()
             self.setCentralWidget(central_widget)
             layout = QVBoxLayout(central_widget)
@@ -56,19 +62,22 @@ class ProjectManagementUI(QMainWindow):
 
             # Header
             header = QLabel("Manage Projects")
-            header.setFont(QFont("Arial", 24, QFont.Bold))
+            header.setFont(_HEADER_FONT)
             header.setAlignment(Qt.AlignCenter)
             layout.addWidget(header)
 
             # Description
             description = QLabel("Select a project to manage:")
-            description.setFont(QFont("Arial", 12))
+            description.setFont(_BODY_FONT)
             layout.addWidget(description)
 
             # Initialize project list
             self.project_list = QListWidget()
             self.project_list.setAlternatingRowColors(True)
-            self.project_list.setFont(QFont("Arial", 11))
+            self.project_list.setUniformItemSizes(True)
+            self.project_list.setLayoutMode(QListWidget.Batched)
+            self.project_list.setBatchSize(200)
+            self.project_list.setFont(_LIST_FONT)
             self.project_list.setMinimumHeight(200)
             layout.addWidget(self.project_list)
 
@@ -112,9 +121,6 @@ class ProjectManagementUI(QMainWindow):
             self.setMinimumSize(500, 400)
             self.setGeometry(300, 300, 600, 500)
 
-            # Load initial project list
-            self.load_projects()
-
         except Exception as e:
             logger.error(f"Error initializing UI: {str(e)}")
             raise
@@ -122,7 +128,7 @@ class ProjectManagementUI(QMainWindow):
     def create_styled_button(self, text, style="normal"):
         """Create a styled button with the given text and style."""
         btn = QPushButton(text)
-        btn.setFont(QFont("Arial", 12))
+        btn.setFont(_BODY_FONT)
         btn.setMinimumWidth(120)
 
         if style == "critical":
@@ -132,17 +138,19 @@ class ProjectManagementUI(QMainWindow):
 
     def load_projects(self):
         """Load the initial list of projects."""
+        if self.project_list is None:
+            # Not built yet; showEvent loads the list once the UI exists
+            return
         try:
             projects = (
                 self.controller.project_controller.project_manager.list_projects()
             )
-            logger.debug(f"Found {len(projects)} projects")
+            logger.debug("Found %d projects", len(projects))
 
             self.project_list.clear()
-            for project_name in sorted(projects):
-                item = QListWidgetItem(project_name)
-                item.setFlags(item.flags() | Qt.ItemIsSelectable | Qt.ItemIsEnabled)
-                self.project_list.addItem(item)
+            # Plain strings in one call; the default item flags are already
+            # selectable and enabled
+            self.project_list.addItems(sorted(projects))
 
             if self.delete_button:
                 self.delete_button.setEnabled(False)
@@ -163,12 +171,10 @@ class ProjectManagementUI(QMainWindow):
     def on_selection_changed(self):
         """Handle selection changes in the project list."""
         if self.delete_button:
-            selected = len(self.project_list.selectedItems()) > 0
-            self.delete_button.setEnabled(selected)
-            if selected:
-                logger.debug(
-                    f"Selected project: {self.project_list.selectedItems()[0].text()}"
-                )
+            selected_items = self.project_list.selectedItems()
+            self.delete_button.setEnabled(bool(selected_items))
+            if selected_items and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Selected project: %s", selected_items[0].text())
 
     def delete_project(self):
         """Delete the selected project after confirmation."""
@@ -177,7 +183,7 @@ class ProjectManagementUI(QMainWindow):
             return
 
         project_name = selected_items[0].text()
-        logger.debug(f"Attempting to delete project: {project_name}")
+        logger.debug("Attempting to delete project: %s", project_name)
 
         # Check if project is currently loaded
         if (
@@ -247,6 +253,7 @@ class ProjectManagementUI(QMainWindow):
     def showEvent(self, event):
         """Handle window show event."""
         try:
+            self._ensure_ui()
             super().showEvent(event)
             # Refresh the project list when the window is shown
             self.refresh_project_list()
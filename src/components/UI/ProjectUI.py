@@ -1,17 +1,18 @@
+import difflib
 import logging
 import os
-import re
-from pathlib import Path
+import stat
+from typing import Any, Optional, Sequence, Tuple
 
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QCloseEvent, QFont, QIcon
+from PyQt5.QtCore import QStringListModel, Qt, pyqtSignal, pyqtSlot
+from PyQt5.QtGui import QCloseEvent, QFont
 from PyQt5.QtWidgets import (
     QFileDialog,
     QFrame,
     QHBoxLayout,
     QLabel,
     QLineEdit,
-    QListWidget,
+    QListView,
     QMessageBox,
     QPushButton,
     QVBoxLayout,
@@ -20,29 +21,34 @@ from PyQt5.QtWidgets import (
 
 from models.Project import Project
 from utilities.error_handler import handle_exception
-from utilities.resource_path import get_resource_path
+from utilities.icons import get_app_icon
 from utilities.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
+# Characters not allowed in project names (they form the config file name)
+_INVALID_NAME_CHARS = frozenset('<>:"/\\|?*')
+
 
 class ProjectUI(QWidget):
     project_created = pyqtSignal(object)
     project_loaded = pyqtSignal(object)
 
-    def __init__(self, controller):
+    def __init__(self, controller: Any) -> None:
         super().__init__()
         self.controller = controller
         self.theme_manager = ThemeManager.getInstance()
+        self._last_projects: Optional[Tuple[str, ...]] = None
+        self._shutting_down = False
         self.init_ui()
 
         # Connect theme changes
         self.theme_manager.themeChanged.connect(self.apply_theme)
 
-    def init_ui(self):
+    def init_ui(self) -> None:
         """Initialize the UI components"""
         self.setWindowTitle("Project Manager")
-        self.setWindowIcon(QIcon(get_resource_path("assets/images/GynTree_logo.ico")))
+        self.setWindowIcon(get_app_icon())
 
         main_layout = QVBoxLayout()
         main_layout.setContentsMargins(30, 30, 30, 30)
@@ -89,7 +95,12 @@ class ProjectUI(QWidget):
         load_title.setFont(QFont("Arial", 24, QFont.Bold))
         load_layout.addWidget(load_title)
 
-        self.project_list = QListWidget()
+        self._projects_model = QStringListModel(self)
+        self.project_list = QListView()
+        self.project_list.setModel(self._projects_model)
+        self.project_list.setEditTriggers(QListView.NoEditTriggers)
+        self.project_list.setUniformItemSizes(True)
+        self.project_list.setLayoutMode(QListView.Batched)
         self.refresh_project_list()
         load_layout.addWidget(self.project_list)
 
@@ -103,19 +114,46 @@ class ProjectUI(QWidget):
         self.setGeometry(300, 300, 600, 600)
         self.apply_theme()
 
-    def create_styled_button(self, text):
+    def create_styled_button(self, text: str) -> QPushButton:
         """Create a styled button with consistent appearance"""
         btn = QPushButton(text)
         btn.setFont(QFont("Arial", 14))
         return btn
 
-    def refresh_project_list(self):
+    def refresh_project_list(self) -> None:
         """Refresh the list of available projects"""
-        self.project_list.clear()
-        projects = self.controller.project_controller.project_manager.list_projects()
-        self.project_list.addItems(projects)
-
-    def select_directory(self):
+        projects = tuple(
+            self.controller.project_controller.project_manager.list_projects()
+        )
+        if projects == self._last_projects:
+            return
+        if not self._last_projects:
+            self._projects_model.setStringList(projects)
+        else:
+            self.project_list.setUpdatesEnabled(False)
+            try:
+                self._patch_project_list(self._last_projects, projects)
+            finally:
+                self.project_list.setUpdatesEnabled(True)
+        self._last_projects = projects
+
+    def _patch_project_list(self, old: Sequence[str], new: Sequence[str]) -> None:
+        """Apply only the rows that differ between old and new to the model"""
+        model = self._projects_model
+        opcodes = difflib.SequenceMatcher(None, old, new, autojunk=False).get_opcodes()
+        # Walk backwards so earlier row numbers stay valid while patching
+        for tag, i1, i2, j1, j2 in reversed(opcodes):
+            if tag == "equal":
+                continue
+            if i2 > i1:
+                model.removeRows(i1, i2 - i1)
+            if j2 > j1:
+                model.insertRows(i1, j2 - j1)
+                for offset, name in enumerate(new[j1:j2]):
+                    model.setData(model.index(i1 + offset), name)
+
+    @pyqtSlot()
+    def select_directory(self) -> None:
         """Handle directory selection"""
         directory = QFileDialog.getExistingDirectory(
             self,
@@ -126,13 +164,12 @@ class ProjectUI(QWidget):
         if directory:
             self.start_dir_label.setText(directory)
 
-    def validate_project_name(self, name):
+    def validate_project_name(self, name: str) -> Tuple[bool, str]:
         """Validate project name for illegal characters and length"""
         if not name:
             return False, "Project name cannot be empty"
 
-        invalid_chars = r'[<>:"/\\|?*]'
-        if re.search(invalid_chars, name):
+        if not _INVALID_NAME_CHARS.isdisjoint(name):
             return False, "Project name contains invalid characters"
 
         if len(name) > 255:
@@ -140,29 +177,32 @@ class ProjectUI(QWidget):
 
         return True, ""
 
-    def validate_directory(self, directory):
+    def validate_directory(self, directory: str) -> Tuple[bool, str]:
         """Validate selected directory"""
         if directory == "No directory selected":
             return False, "Please select a directory"
 
         try:
-            path = Path(directory)
-            if not path.exists():
+            # One stat call answers both existence and type
+            try:
+                mode = os.stat(directory).st_mode
+            except (FileNotFoundError, NotADirectoryError):
                 return False, "Selected directory does not exist"
 
-            if not path.is_dir():
+            if not stat.S_ISDIR(mode):
                 return False, "Selected path is not a directory"
 
             # Check if directory is readable
-            if not os.access(path, os.R_OK):
+            if not os.access(directory, os.R_OK):
                 return False, "Directory is not accessible"
 
             return True, ""
         except Exception as e:
             return False, f"Invalid directory path: {str(e)}"
 
+    @pyqtSlot()
     @handle_exception
-    def create_project(self, *args):
+    def create_project(self, *args: Any) -> None:
         """
         Handle project creation with validation.
 
@@ -191,9 +231,7 @@ class ProjectUI(QWidget):
             # Emit the signal
             self.project_created.emit(new_project)
 
-            # Clear inputs
-            self.project_name_input.clear()
-            self.start_dir_label.setText("No directory selected")
+            self.reset_inputs()
 
             # Close the window
             self.close()
@@ -202,17 +240,18 @@ class ProjectUI(QWidget):
             logger.error(f"Error creating project: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to create project: {str(e)}")
 
-    def load_project(self):
+    @pyqtSlot()
+    def load_project(self) -> None:
         """Handle project loading with proper validation."""
-        selected_items = self.project_list.selectedItems()
-        if not selected_items:
+        selected_indexes = self.project_list.selectionModel().selectedIndexes()
+        if not selected_indexes:
             QMessageBox.warning(
                 self, "No Selection", "Please select a project to load."
             )
             return
 
         try:
-            project_name = selected_items[0].text()
+            project_name = selected_indexes[0].data()
             logger.info(f"Loading project: {project_name}")
 
             # Load the project from the controller
@@ -230,12 +269,27 @@ class ProjectUI(QWidget):
             logger.error(f"Error loading project: {str(e)}")
             QMessageBox.warning(self, "Error", f"Failed to load project: {str(e)}")
 
-    def apply_theme(self):
+    @pyqtSlot()
+    def apply_theme(self) -> None:
         """Apply current theme to the UI"""
         if self.theme_manager:
             self.theme_manager.apply_theme(self)
 
-    def closeEvent(self, event: QCloseEvent):
-        """Handle window close event"""
-        event.accept()
-        super().closeEvent(event)
+    def reset_inputs(self) -> None:
+        """Clear the form and list selection left over from a previous use"""
+        self.project_name_input.clear()
+        self.start_dir_label.setText("No directory selected")
+        self.project_list.clearSelection()
+
+    def shutdown(self) -> None:
+        """Close for real instead of hiding; used when the application exits"""
+        self._shutting_down = True
+        self.close()
+
+    def closeEvent(self, event: QCloseEvent) -> None:
+        """Hide instead of closing so the widget tree is reused on next open"""
+        if self._shutting_down:
+            super().closeEvent(event)
+            return
+        self.hide()
+        event.ignore()
@@ -1,13 +1,23 @@
 import csv
+import heapq
+import io
 import logging
 import os
-import shutil
-import tempfile
 import time
 
-from PyQt5.QtCore import Qt, QTimer, pyqtSignal
-from PyQt5.QtGui import QFont, QIcon
+from PyQt5.QtCore import (
+    QMimeData,
+    QObject,
+    QRunnable,
+    Qt,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+    pyqtSlot,
+)
+from PyQt5.QtGui import QFont
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QDesktopWidget,
     QFileDialog,
@@ -17,17 +27,108 @@ from PyQt5.QtWidgets import (
     QMainWindow,
     QPushButton,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
     QWidget,
 )
 
-from utilities.resource_path import get_resource_path
+from components.ResultModel import ResultModel
+from utilities.icons import get_app_icon
 from utilities.theme_manager import ThemeManager
 
 logger = logging.getLogger(__name__)
 
+# Exports are written through a 1 MiB buffer to keep write syscalls few
+_EXPORT_BUFFER_SIZE = 1 << 20
+
+# Above this many rows only the longest path strings are measured; a few
+# are sampled because character count only approximates proportional width
+_MAX_MEASURED_ROWS = 10_000
+_MEASURED_SAMPLE_SIZE = 32
+
+
+def _csv_rows(paths, descriptions):
+    """Yield the CSV header followed by one (path, description) row per result"""
+    yield ("Path", "Description")
+    yield from zip(paths, descriptions)
+
+
+class ExportSignals(QObject):
+    finished = pyqtSignal(str)  # saved file name
+    error = pyqtSignal(str)
+
+
+class ExportWorker(QRunnable):
+    """Export results off the UI thread, renaming a sibling temp file into place"""
+
+    def __init__(
+        self,
+        file_name,
+        file_type,
+        paths,
+        descriptions,
+        max_retries,
+        retry_delay,
+    ):
+        super().__init__()
+        self.file_name = file_name
+        self.file_type = file_type
+        self.paths = paths
+        self.descriptions = descriptions
+        # Unparented and owned by this export, so it outlives a closed window;
+        # Qt drops the connections when the receiving window is destroyed
+        self.signals = ExportSignals()
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+
+    def run(self):
+        temp_name = None
+        try:
+            target_dir = os.path.dirname(self.file_name)
+            if target_dir:
+                os.makedirs(target_dir, exist_ok=True)
+
+            # Same directory as the target, so the final rename never copies bytes
+            temp_name = f"{self.file_name}.{os.urandom(6).hex()}.tmp"
+            with open(
+                temp_name,
+                "x",
+                encoding="utf-8",
+                newline="",
+                buffering=_EXPORT_BUFFER_SIZE,
+            ) as file:
+                if self.file_type == "txt":
+                    file.writelines(
+                        f"{path}: {description}\n"
+                        for path, description in zip(self.paths, self.descriptions)
+                    )
+                else:
+                    csv.writer(file).writerows(_csv_rows(self.paths, self.descriptions))
+
+            # Atomically replace the target, retrying while it is locked
+            for attempt in range(self.max_retries):
+                try:
+                    os.replace(temp_name, self.file_name)
+                    temp_name = None
+                    self.signals.finished.emit(self.file_name)
+                    return
+                except OSError as e:
+                    if attempt < self.max_retries - 1:
+                        logger.warning(f"Retry {attempt + 1} failed: {str(e)}")
+                        time.sleep(self.retry_delay)
+                    else:
+                        raise
+        except Exception as e:
+            self.signals.error.emit(str(e))
+        finally:
+            if temp_name and os.path.exists(temp_name):
+                try:
+                    os.remove(temp_name)
+                except OSError as e:
+                    logger.error(
+                        f"Failed to cleanup temporary file {temp_name}: {str(e)}"
+                    )
+
 
 class ResultUI(QMainWindow):
     # Define signals for operations
@@ -41,30 +142,15 @@ class ResultUI(QMainWindow):
         self.controller = controller
         self.theme_manager = theme_manager
         self.directory_analyzer = directory_analyzer
-        self.result_data = None
+        self._results_loaded = False
         self._max_retries = 3
         self._retry_delay = 0.5
-        self._temp_files = []
         self.init_ui()
         self.theme_manager.themeChanged.connect(self.apply_theme)
 
-    def __del__(self):
-        """Cleanup temporary resources upon deletion"""
-        self._cleanup_temp_files()
-
-    def _cleanup_temp_files(self):
-        """Clean up any temporary files created during export."""
-        for temp_file in self._temp_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-            except Exception as e:
-                logger.error(f"Failed to cleanup temporary file {temp_file}: {str(e)}")
-        self._temp_files.clear()
-
     def init_ui(self):
         self.setWindowTitle("Analysis Results")
-        self.setWindowIcon(QIcon(get_resource_path("assets/images/GynTree_logo.ico")))
+        self.setWindowIcon(get_app_icon())
 
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -78,31 +164,52 @@ class ResultUI(QMainWindow):
         title.setMaximumHeight(40)
         layout.addWidget(title)
 
-        self.result_table = QTableWidget()
-        self.result_table.setColumnCount(2)
-        self.result_table.setHorizontalHeaderLabels(["Path", "Description"])
+        self.result_model = ResultModel(self)
+        self.result_table = QTableView()
+        self.result_table.setModel(self.result_model)
+        # Widths are set explicitly, so neither column is re-measured per update
         header = self.result_table.horizontalHeader()
         header.setSectionResizeMode(0, QHeaderView.Interactive)
-        header.setSectionResizeMode(1, QHeaderView.Stretch)
-        self.result_table.verticalHeader().setVisible(False)
-        self.result_table.setWordWrap(True)
-        self.result_table.setTextElideMode(Qt.ElideNone)
+        header.setSectionResizeMode(1, QHeaderView.Fixed)
+        header.sectionResized.connect(self._on_section_resized)
+        # One fixed row height, so no row is ever measured; long text is
+        # elided in the cell and shown in full as a tooltip
+        rows_header = self.result_table.verticalHeader()
+        rows_header.setVisible(False)
+        rows_header.setSectionResizeMode(QHeaderView.Fixed)
+        self.result_table.setWordWrap(False)
+        self.result_table.setTextElideMode(Qt.ElideRight)
         self.result_table.setShowGrid(True)
+        # Scroll by pixel and keep a flat background so scrolling repaints
+        # only the exposed strip
+        self.result_table.setAlternatingRowColors(False)
+        self.result_table.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.result_table.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
         layout.addWidget(self.result_table)
 
+        # Collapses bursts of resizes into one column adjustment per frame
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(16)
+        self._resize_timer.timeout.connect(self.adjust_column_widths)
+
         button_layout = QHBoxLayout()
         button_layout.setSpacing(15)
 
+        fit_button = self.create_styled_button("Fit Columns")
+        fit_button.clicked.connect(self.fit_columns)
+        button_layout.addWidget(fit_button)
+
         copy_button = self.create_styled_button("Copy to Clipboard")
         copy_button.clicked.connect(self.copy_to_clipboard)
         button_layout.addWidget(copy_button)
 
         save_txt_button = self.create_styled_button("Save as TXT")
-        save_txt_button.clicked.connect(lambda: self.save_file("txt"))
+        save_txt_button.clicked.connect(self._save_txt)
         button_layout.addWidget(save_txt_button)
 
         save_csv_button = self.create_styled_button("Save as CSV")
-        save_csv_button.clicked.connect(lambda: self.save_file("csv"))
+        save_csv_button.clicked.connect(self._save_csv)
         button_layout.addWidget(save_csv_button)
 
         layout.addLayout(button_layout)
@@ -125,35 +232,18 @@ class ResultUI(QMainWindow):
     def update_result(self):
         """Updates the result table with data from the directory analyzer."""
         try:
-            # Get data from the directory analyzer passed during initialization
-            self.result_data = self.directory_analyzer.get_flat_structure()
-
-            # Clear existing table data
-            self.result_table.setRowCount(0)
-
-            # Set the row count before populating
-            self.result_table.setRowCount(len(self.result_data))
-
-            # Populate table
-            max_path_width = 0
-            for row, item in enumerate(self.result_data):
-                path_item = QTableWidgetItem(item["path"])
-                desc_item = QTableWidgetItem(item["description"])
-                self.result_table.setItem(row, 0, path_item)
-                self.result_table.setItem(row, 1, desc_item)
-                max_path_width = max(
-                    max_path_width, self.result_table.fontMetrics().width(item["path"])
-                )
+            # The model keeps only the path and description columns
+            self.result_model.set_rows(self.directory_analyzer.get_flat_structure())
+            self._results_loaded = True
+
+            table = self.result_table
+            max_path_width = self._path_column_width(table.fontMetrics())
 
             padding = 50
-            self.result_table.setColumnWidth(0, max_path_width + padding)
-            self.result_table.horizontalHeader().setSectionResizeMode(
-                1, QHeaderView.Stretch
-            )
-            self.result_table.resizeRowsToContents()
+            table.setColumnWidth(0, max_path_width + padding)
 
             # Ensure column widths are properly adjusted
-            QTimer.singleShot(0, self.adjust_column_widths)
+            self._resize_timer.start()
 
             # Emit signal after successful update
             self.resultUpdated.emit()
@@ -162,6 +252,16 @@ class ResultUI(QMainWindow):
             logger.error(f"Error updating results: {str(e)}")
             self.error.emit(f"Failed to update results: {str(e)}")
 
+    def _path_column_width(self, font_metrics):
+        """Return the pixel width of the widest path in the current results"""
+        paths = self.result_model.paths()
+        if not paths:
+            return 0
+        if len(paths) > _MAX_MEASURED_ROWS:
+            paths = heapq.nlargest(_MEASURED_SAMPLE_SIZE, paths, key=len)
+        return max(map(font_metrics.horizontalAdvance, paths))
+
+    @pyqtSlot()
     def adjust_column_widths(self):
         """Adjust the widths of the result table columns to fit the available space."""
         try:
@@ -173,26 +273,57 @@ class ResultUI(QMainWindow):
             logger.error(f"Error adjusting column widths: {str(e)}")
             self.error.emit(f"Failed to adjust columns: {str(e)}")
 
+    @pyqtSlot()
+    def fit_columns(self):
+        """Size the path column to its contents once, then fill the rest"""
+        try:
+            header = self.result_table.horizontalHeader()
+            header.setSectionResizeMode(0, QHeaderView.ResizeToContents)
+            self.result_table.resizeColumnToContents(0)
+            header.setSectionResizeMode(0, QHeaderView.Interactive)
+            self.adjust_column_widths()
+        except Exception as e:
+            logger.error(f"Error fitting columns: {str(e)}")
+            self.error.emit(f"Failed to fit columns: {str(e)}")
+
+    @pyqtSlot(int, int, int)
+    def _on_section_resized(self, logical_index, old_size, new_size):
+        # The description column follows the path column
+        if logical_index == 0:
+            self._resize_timer.start()
+
+    @pyqtSlot()
     def copy_to_clipboard(self):
         """Copy the result data to the system clipboard."""
         try:
-            clipboard_text = "Path,Description\n"
-            for row in range(self.result_table.rowCount()):
-                row_data = [
-                    self.result_table.item(row, col).text()
-                    for col in range(self.result_table.columnCount())
-                ]
-                clipboard_text += ",".join(row_data) + "\n"
-            QApplication.clipboard().setText(clipboard_text)
+            buffer = io.StringIO()
+            csv.writer(buffer, lineterminator="\n").writerows(
+                _csv_rows(self.result_model.paths(), self.result_model.descriptions())
+            )
+            text = buffer.getvalue()
+            # One CSV pass serves both plain-text and spreadsheet targets
+            mime_data = QMimeData()
+            mime_data.setText(text)
+            mime_data.setData("text/csv", text.encode("utf-8"))
+            QApplication.clipboard().setMimeData(mime_data)
             self.clipboardCopyComplete.emit()
         except Exception as e:
             logger.error(f"Error copying to clipboard: {str(e)}")
             self.error.emit(f"Failed to copy to clipboard: {str(e)}")
 
+    @pyqtSlot()
+    def _save_txt(self):
+        self.save_file("txt")
+
+    @pyqtSlot()
+    def _save_csv(self):
+        self.save_file("csv")
+
+    @pyqtSlot(str)
     def save_file(self, file_type):
-        """Save the result data to a file (TXT or CSV)."""
+        """Save the result data to a file (TXT or CSV) on a pool thread."""
         try:
-            if not self.result_data:
+            if not self.result_model.rowCount():
                 logger.warning("No data to save")
                 return
 
@@ -211,78 +342,52 @@ class ResultUI(QMainWindow):
             if not file_name:
                 return
 
-            # Create temporary file
-            temp_suffix = os.urandom(6).hex()
-            temp_file = tempfile.NamedTemporaryFile(
-                mode="w",
-                delete=False,
-                suffix=f"_{temp_suffix}.{file_type}",
-                encoding="utf-8",
-                newline="",
+            # set_rows replaces the column lists, so the worker can share them
+            worker = ExportWorker(
+                file_name,
+                file_type,
+                self.result_model.paths(),
+                self.result_model.descriptions(),
+                self._max_retries,
+                self._retry_delay,
             )
-            self._temp_files.append(temp_file.name)
-
-            # Write to temporary file
-            with open(temp_file.name, "w", encoding="utf-8", newline="") as file:
-                if file_type == "txt":
-                    for item in self.result_data:
-                        file.write(f"{item['path']}: {item['description']}\n")
-                elif file_type == "csv":
-                    writer = csv.writer(file)
-                    writer.writerow(["Path", "Description"])
-                    for item in self.result_data:
-                        writer.writerow([item["path"], item["description"]])
-
-            # Attempt to move to final location with retries
-            for attempt in range(self._max_retries):
-                try:
-                    # Ensure target directory exists
-                    target_dir = os.path.dirname(file_name)
-                    if target_dir:
-                        os.makedirs(target_dir, exist_ok=True)
-
-                    # If target file exists, try to remove it
-                    if os.path.exists(file_name):
-                        os.remove(file_name)
-
-                    # Copy the file instead of moving it
-                    shutil.copy2(temp_file.name, file_name)
-
-                    # Only remove from tracking if successful
-                    if temp_file.name in self._temp_files:
-                        self._temp_files.remove(temp_file.name)
-
-                    # Always emit signal on successful save
-                    self.saveComplete.emit()
-                    return
-
-                except Exception as e:
-                    if attempt < self._max_retries - 1:
-                        logger.warning(f"Retry {attempt + 1} failed: {str(e)}")
-                        time.sleep(self._retry_delay)
-                    else:
-                        logger.error(f"Failed to save file: {str(e)}")
-                        self.error.emit(f"Failed to save file: {str(e)}")
+            worker.signals.finished.connect(self._on_export_finished)
+            worker.signals.error.connect(self._on_export_error)
+            QThreadPool.globalInstance().start(worker)
 
         except Exception as e:
             logger.error(f"Error saving file: {str(e)}")
             self.error.emit(f"Failed to save file: {str(e)}")
-        finally:
-            self._cleanup_temp_files()
+
+    @pyqtSlot(str)
+    def _on_export_finished(self, file_name):
+        logger.debug(f"Results saved to {file_name}")
+        self.saveComplete.emit()
+
+    @pyqtSlot(str)
+    def _on_export_error(self, message):
+        logger.error(f"Failed to save file: {message}")
+        self.error.emit(f"Failed to save file: {message}")
 
     def resizeEvent(self, event):
         """Handle window resize events."""
         try:
             super().resizeEvent(event)
-            self.adjust_column_widths()
+            self._resize_timer.start()
         except Exception as e:
             logger.error(f"Error handling resize: {str(e)}")
             self.error.emit(f"Failed to handle resize: {str(e)}")
 
     def refresh_display(self):
-        """Refresh the display with current data."""
-        self.update_result()
-
+        """Refresh the display, re-scanning only if nothing has been loaded yet."""
+        if not self._results_loaded:
+            self.update_result()
+            return
+        # The scan only changes on a new analysis, which calls update_result
+        self._resize_timer.start()
+        self.result_table.viewport().update()
+
+    @pyqtSlot()
     def apply_theme(self):
         """Apply the current theme to the UI."""
         try:
@@ -294,7 +399,6 @@ class ResultUI(QMainWindow):
     def closeEvent(self, event):
         """Handle window close events."""
         try:
-            self._cleanup_temp_files()
             super().closeEvent(event)
         except Exception as e:
             logger.error(f"Error handling close event: {str(e)}")
@@ -1,15 +1,17 @@
 import logging
 import logging.handlers
 import threading
+from functools import cached_property
+from weakref import WeakSet, ref
 
-from PyQt5.QtCore import QObject, pyqtSignal
+from PyQt5.QtCore import QMetaObject, QObject, Qt, QTimer, pyqtSignal, pyqtSlot
 from PyQt5.QtWidgets import QApplication, QMessageBox
 
 from components.UI.DashboardUI import DashboardUI
 from controllers.ProjectController import ProjectController
 from controllers.ThreadController import ThreadController
 from controllers.UIController import UIController
-from utilities.error_handler import handle_exception
+from utilities.error_handler import log_and_handle_exception
 from utilities.logging_decorator import log_method
 from utilities.theme_manager import ThemeManager
 
@@ -22,24 +24,66 @@ class AppController(QObject):
 
     def __init__(self):
         super().__init__()
+        self._qapp = QApplication.instance()
         self.main_ui = DashboardUI(self)
         self.theme_manager = ThemeManager.getInstance()
         self.project_controller = ProjectController(self)
-        self.thread_controller = ThreadController()
         self.ui_controller = UIController(self.main_ui)
-        self.ui_components = []
+        # Windows are owned by the dashboard; only track the live ones here
+        self.ui_components = WeakSet()
         self.project_context = None
         self.current_project_ui = None  # Add reference to current ProjectUI
-
-        # Connect signals
-        self.thread_controller.worker_finished.connect(self._on_auto_exclude_finished)
-        self.thread_controller.worker_error.connect(self._on_auto_exclude_error)
-        self.theme_manager.themeChanged.connect(self.apply_theme_to_all_windows)
+        self._project_ui_connections = set()
+        # Bound once so each ProjectUI signal is wired to the same slot object
+        self._project_ui_slots = {
+            "project_created": self.on_project_created,
+            "project_loaded": self.on_project_loaded,
+        }
+
+        # Collapses bursts of theme changes into one pass over the windows
+        self._theme_timer = QTimer(self)
+        self._theme_timer.setSingleShot(True)
+        self._theme_timer.setInterval(50)
+        self._theme_timer.timeout.connect(self._apply_theme_now)
+
+        # Back-to-back project switches start one auto-exclude run, not several
+        self._auto_exclude_timer = QTimer(self)
+        self._auto_exclude_timer.setSingleShot(True)
+        self._auto_exclude_timer.setInterval(0)
+        self._auto_exclude_timer.timeout.connect(self._run_auto_exclude)
+        # Bumped per started run; only the latest run's outcome reaches the UI
+        self._autoex_generation = 0
+
+        # While the dialog is open or the timer runs, further auto-exclude
+        # errors are logged but not shown
+        self._error_dialog_open = False
+        self._error_dialog_throttle = QTimer(self)
+        self._error_dialog_throttle.setSingleShot(True)
+        self._error_dialog_throttle.setInterval(100)
+
+        # (signal, slot) pairs that cleanup() disconnects
+        self._signal_bindings = []
+        self._bind(self.theme_manager.themeChanged, self.apply_theme_to_all_windows)
 
         # Set initial theme
         initial_theme = self.get_theme_preference()
         self.theme_manager.set_theme(initial_theme)
 
+    @cached_property
+    def thread_controller(self):
+        """Worker pool for auto-exclude, created when the first project opens"""
+        thread_controller = ThreadController()
+        # ThreadController posts worker results to itself and re-emits them on
+        # the GUI thread, so both senders are same-thread
+        self._bind(thread_controller.worker_finished, self._on_auto_exclude_finished)
+        self._bind(thread_controller.worker_error, self._on_auto_exclude_error)
+        return thread_controller
+
+    def _bind(self, signal, slot):
+        """Connect a same-thread signal and remember it for cleanup"""
+        signal.connect(slot, Qt.DirectConnection)
+        self._signal_bindings.append((signal, slot))
+
     def __enter__(self):
         return self
 
@@ -51,102 +95,69 @@ class AppController(QObject):
     def run(self):
         self.main_ui.show_dashboard()
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def cleanup(self):
         logger.debug("Starting cleanup process in AppController")
+        # Never created if no project was opened; don't build it just to tear down
+        thread_controller = self.__dict__.get("thread_controller")
         try:
             # First disconnect signals safely
-            if hasattr(self.thread_controller, "worker_finished") and hasattr(
-                self.thread_controller.worker_finished, "disconnect"
-            ):
+            for signal, slot in self._signal_bindings:
                 try:
-                    self.thread_controller.worker_finished.disconnect(
-                        self._on_auto_exclude_finished
-                    )
-                except Exception as e:
-                    logger.debug(f"Non-critical signal disconnect warning: {e}")
+                    signal.disconnect(slot)
+                except (TypeError, RuntimeError) as e:
+                    logger.debug("Non-critical signal disconnect warning: %s", e)
+            self._signal_bindings.clear()
 
-            if hasattr(self.thread_controller, "worker_error") and hasattr(
-                self.thread_controller.worker_error, "disconnect"
-            ):
-                try:
-                    self.thread_controller.worker_error.disconnect(
-                        self._on_auto_exclude_error
-                    )
-                except Exception as e:
-                    logger.debug(f"Non-critical signal disconnect warning: {e}")
-
-            if hasattr(self.theme_manager, "themeChanged") and hasattr(
-                self.theme_manager.themeChanged, "disconnect"
-            ):
-                try:
-                    self.theme_manager.themeChanged.disconnect(
-                        self.apply_theme_to_all_windows
-                    )
-                except Exception as e:
-                    logger.debug(f"Non-critical signal disconnect warning: {e}")
+            self._theme_timer.stop()
+            self._auto_exclude_timer.stop()
 
             # Clean project context if it exists (do this before thread cleanup)
-            if self.project_controller and self.project_controller.project_context:
+            project_context = self._project_context()
+            if project_context:
                 try:
-                    self.project_controller.project_context.close()
+                    project_context.close()
                 except Exception as e:
-                    logger.debug(f"Non-critical project context cleanup warning: {e}")
+                    logger.debug("Non-critical project context cleanup warning: %s", e)
 
-            # Clean thread controller with proper waiting
-            if hasattr(self, "thread_controller") and self.thread_controller:
+            # cleanup_thread() blocks on QThreadPool.waitForDone with its own timeout
+            if thread_controller:
                 try:
-                    cleanup_event = threading.Event()
-
-                    def on_cleanup_complete():
-                        cleanup_event.set()
-
-                    self.thread_controller.cleanup_complete.connect(on_cleanup_complete)
-                    self.thread_controller.cleanup_thread()
-
-                    # Wait for cleanup with timeout
-                    if not cleanup_event.wait(timeout=2.0):  # 2 second timeout
-                        logger.warning("Thread cleanup timed out")
+                    thread_controller.cleanup_thread()
                 except Exception as e:
-                    logger.debug(f"Non-critical thread cleanup warning: {e}")
+                    logger.debug("Non-critical thread cleanup warning: %s", e)
 
             # Clean UI components
-            for ui in list(self.ui_components):
-                if ui is not None:
-                    try:
-                        ui.close()
-                    except Exception:
-                        pass
-                    try:
-                        ui.deleteLater()
-                    except Exception:
-                        pass
-                    try:
-                        self.ui_components.remove(ui)
-                    except Exception:
-                        pass
+            pending = list(self.ui_components)
+            self.ui_components.clear()
+            for ui in pending:
+                try:
+                    ui.close()
+                    ui.deleteLater()
+                except Exception:
+                    pass
 
             # Clean current ProjectUI if exists
             if self.current_project_ui:
                 try:
-                    self.current_project_ui.close()
+                    self.current_project_ui.shutdown()
                     self.current_project_ui.deleteLater()
                     self.current_project_ui = None
                 except Exception as e:
-                    logger.debug(f"Non-critical ProjectUI cleanup warning: {e}")
+                    logger.debug("Non-critical ProjectUI cleanup warning: %s", e)
 
-            # Close windows
+            # Every other top-level is tracked above, so only the dashboard is left
             try:
-                QApplication.closeAllWindows()
+                self.main_ui.close()
             except Exception as e:
-                logger.debug(f"Non-critical window cleanup warning: {e}")
+                logger.debug("Non-critical window cleanup warning: %s", e)
 
             # Final check for threads
             remaining_threads = threading.active_count() - 1  # Subtract main thread
             if remaining_threads > 0:
                 logger.debug(
-                    f"{remaining_threads} background threads still active during cleanup"
+                    "%d background threads still active during cleanup",
+                    remaining_threads,
                 )
 
         except Exception as e:
@@ -159,9 +170,13 @@ class AppController(QObject):
         new_theme = self.theme_manager.toggle_theme()
         self.set_theme_preference(new_theme)
 
+    @pyqtSlot(str)
     def apply_theme_to_all_windows(self, theme):
-        app = QApplication.instance()
-        self.theme_manager.apply_theme_to_all_windows(app)
+        self._theme_timer.start()
+
+    @pyqtSlot()
+    def _apply_theme_now(self):
+        self.theme_manager.apply_theme_to_all_windows(self._qapp)
 
     def get_theme_preference(self):
         return (
@@ -174,25 +189,16 @@ class AppController(QObject):
         if self.project_controller:
             self.project_controller.set_theme_preference(theme)
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def create_project_action(self, *args):
         logger.debug("Creating project UI")
-        if self.current_project_ui:
-            self.current_project_ui.close()
-            self.current_project_ui = None
-
-        self.current_project_ui = self.main_ui.show_project_ui()
-        if self.current_project_ui:
-            self.current_project_ui.project_created.connect(self.on_project_created)
-            self.ui_components.append(self.current_project_ui)
-            self.current_project_ui.show()  # Explicitly show the window
+        self._show_project_ui("project_created")
 
-    @handle_exception
-    @log_method
+    @pyqtSlot(object)
+    @log_and_handle_exception
     def on_project_created(self, project):
         """Handle project created signal."""
-        logger.info(f"Project created signal received for project: {project.name}")
+        logger.info("Project created signal received for project: %s", project.name)
         try:
             success = self.project_controller.create_project(project)
             if success:
@@ -200,37 +206,72 @@ class AppController(QObject):
                 self.project_context = self.project_controller.project_context
                 self.project_created.emit(project)
                 self.main_ui.update_project_info(project)
-                self.after_project_loaded()
+                # Let the dashboard repaint before the UI reset and auto-exclude
+                QMetaObject.invokeMethod(
+                    self, "after_project_loaded", Qt.QueuedConnection
+                )
             else:
                 logger.error(f"Failed to create project: {project.name}")
                 QMessageBox.critical(
                     self.main_ui, "Error", "Failed to create project. Please try again."
                 )
         except Exception as e:
-            logger.exception(f"Exception occurred while creating project: {str(e)}")
+            # The dialog below reports the error; keep the traceback for debugging
+            logger.error(
+                "Exception occurred while creating project: %s",
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
+            )
             QMessageBox.critical(
                 self.main_ui, "Error", f"An unexpected error occurred: {str(e)}"
             )
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def load_project_action(self, *args):
         logger.debug("Loading project UI")
-        if self.current_project_ui:
-            self.current_project_ui.close()
-            self.current_project_ui = None
-
-        self.current_project_ui = self.main_ui.show_project_ui()
-        if self.current_project_ui:
-            self.current_project_ui.project_loaded.connect(self.on_project_loaded)
-            self.ui_components.append(self.current_project_ui)
-            self.current_project_ui.show()  # Explicitly show the window
-
-    @handle_exception
-    @log_method
+        self._show_project_ui("project_loaded")
+
+    def _show_project_ui(self, signal_name):
+        """Show the shared ProjectUI, connecting its signal to our slot only once"""
+        project_ui = self.main_ui.show_project_ui()
+        if not project_ui:
+            return None
+        if project_ui is not self.current_project_ui:
+            self.current_project_ui = project_ui
+            self._project_ui_connections = set()
+            self._track_ui(project_ui)
+        if signal_name not in self._project_ui_connections:
+            getattr(project_ui, signal_name).connect(
+                self._project_ui_slots[signal_name], Qt.DirectConnection
+            )
+            self._project_ui_connections.add(signal_name)
+        return project_ui
+
+    def _project_context(self):
+        """Return the current project context, or None if no project is loaded"""
+        if not self.project_controller:
+            return None
+        return self.project_controller.project_context
+
+    def _track_ui(self, ui):
+        """Remember a window for cleanup without keeping it alive"""
+        if ui is None or ui in self.ui_components:
+            return
+        self.ui_components.add(ui)
+        # Drop the window as soon as Qt deletes it, even if its wrapper lives on
+        ui_ref = ref(ui)
+        ui.destroyed.connect(lambda *_: self._untrack_ui(ui_ref))
+
+    def _untrack_ui(self, ui_ref):
+        ui = ui_ref()
+        if ui is not None:
+            self.ui_components.discard(ui)
+
+    @pyqtSlot(object)
+    @log_and_handle_exception
     def on_project_loaded(self, project):
         """Handle the project loaded signal."""
-        logger.info(f"Project loaded signal received for project: {project.name}")
+        logger.info("Project loaded signal received for project: %s", project.name)
         try:
             # Project is already loaded in ProjectController, just need to update UI
             if (
@@ -241,7 +282,10 @@ class AppController(QObject):
                 self.project_context = self.project_controller.project_context
                 self.project_loaded.emit(project)
                 self.main_ui.update_project_info(project)
-                self.after_project_loaded()
+                # Let the dashboard repaint before the UI reset and auto-exclude
+                QMetaObject.invokeMethod(
+                    self, "after_project_loaded", Qt.QueuedConnection
+                )
             else:
                 logger.error(
                     f"Project context not properly initialized for {project.name}"
@@ -252,15 +296,17 @@ class AppController(QObject):
                     "Failed to initialize project. Please try again.",
                 )
         except Exception as e:
-            logger.exception(
-                f"Exception occurred while handling loaded project: {str(e)}"
+            logger.error(
+                "Exception occurred while handling loaded project: %s",
+                e,
+                exc_info=logger.isEnabledFor(logging.DEBUG),
             )
             QMessageBox.critical(
                 self.main_ui, "Error", f"An unexpected error occurred: {str(e)}"
             )
 
-    @handle_exception
-    @log_method
+    @pyqtSlot()
+    @log_and_handle_exception
     def after_project_loaded(self):
         """Handle post-project-load initialization."""
         try:
@@ -289,35 +335,53 @@ class AppController(QObject):
             )
             raise
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def _start_auto_exclude(self):
         """Start the auto-exclude analysis process."""
         try:
-            if not self.project_controller.project_context:
+            project_context = self.project_controller.project_context
+            if not project_context:
                 raise RuntimeError("Cannot start auto-exclude: No project context")
 
-            logger.debug("Starting auto-exclude analysis")
-            self.thread_controller.start_auto_exclude_thread(
-                self.project_controller.project_context
-            )
+            logger.debug("Scheduling auto-exclude analysis")
+            self._auto_exclude_timer.start()
 
         except Exception as e:
             logger.error(f"Failed to start auto-exclude analysis: {str(e)}")
             raise
 
-    @handle_exception
-    @log_method
+    @pyqtSlot()
+    def _run_auto_exclude(self):
+        """Start one auto-exclude worker for the project that is current now"""
+        project_context = self._project_context()
+        if not project_context:
+            return
+        logger.debug("Starting auto-exclude analysis")
+        worker = self.thread_controller.start_auto_exclude_thread(project_context)
+        if worker:
+            self._autoex_generation += 1
+            worker.generation = self._autoex_generation
+
+    def _is_superseded_auto_exclude(self):
+        """Whether the run now reporting was followed by a newer one"""
+        worker = self.thread_controller.reporting_worker
+        generation = getattr(worker, "generation", self._autoex_generation)
+        return generation != self._autoex_generation
+
+    @pyqtSlot(list)
+    @log_and_handle_exception
     def _on_auto_exclude_finished(self, formatted_recommendations):
         """Handle completion of auto-exclude analysis."""
+        if self._is_superseded_auto_exclude():
+            logger.debug("Dropping auto-exclude results superseded by a newer run")
+            return
         try:
-            if not self.project_controller.project_context:
+            project_context = self.project_controller.project_context
+            if not project_context:
                 logger.warning("No project context available for auto-exclude results")
                 return
 
-            auto_exclude_manager = (
-                self.project_controller.project_context.auto_exclude_manager
-            )
+            auto_exclude_manager = project_context.auto_exclude_manager
             if not auto_exclude_manager:
                 logger.warning("No auto-exclude manager available")
                 return
@@ -327,41 +391,57 @@ class AppController(QObject):
                 logger.info("New auto-exclude recommendations found, showing UI")
                 auto_exclude_ui = self.main_ui.show_auto_exclude_ui(
                     auto_exclude_manager,
-                    self.project_controller.project_context.settings_manager,
+                    project_context.settings_manager,
                     formatted_recommendations,
-                    self.project_controller.project_context,
+                    project_context,
                 )
-                self.ui_components.append(auto_exclude_ui)
+                self._track_ui(auto_exclude_ui)
             else:
                 logger.info("No new exclusions to suggest")
                 self.main_ui.show_dashboard()
 
         except Exception as e:
             logger.error(f"Error processing auto-exclude results: {str(e)}")
-            self._on_auto_exclude_error(str(e))
+            self._show_auto_exclude_error(str(e))
 
-    @handle_exception
-    @log_method
+    @pyqtSlot(str)
+    @log_and_handle_exception
     def _on_auto_exclude_error(self, error_msg):
+        if self._is_superseded_auto_exclude():
+            logger.debug(
+                "Ignoring error from superseded auto-exclude run: %s", error_msg
+            )
+            return
+        self._show_auto_exclude_error(error_msg)
+
+    def _show_auto_exclude_error(self, error_msg):
         logger.error(f"Auto-exclude error: {error_msg}")
-        QMessageBox.critical(
-            self.main_ui,
-            "Error",
-            f"An error occurred during auto-exclusion:\n{error_msg}",
-        )
+        if self._error_dialog_open or self._error_dialog_throttle.isActive():
+            return
+        # Leading edge: the first error of a burst gets the dialog and the
+        # dashboard transition, the rest are only logged. The modal dialog runs
+        # a nested event loop, so errors delivered while it is open are
+        # suppressed by the flag and the window only starts once it closes
+        self._error_dialog_open = True
+        try:
+            QMessageBox.critical(
+                self.main_ui,
+                "Error",
+                f"An error occurred during auto-exclusion:\n{error_msg}",
+            )
+        finally:
+            self._error_dialog_open = False
+            self._error_dialog_throttle.start()
         self.main_ui.show_dashboard()
 
-    @handle_exception
-    @log_method
     def manage_projects(self, *args):
         """Handle the manage projects action."""
         logger.debug("Opening project management UI")
         project_management_ui = self.main_ui.show_project_management()
         project_management_ui.project_deleted.connect(self._handle_project_deleted)
-        self.ui_components.append(project_management_ui)
+        self._track_ui(project_management_ui)
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def _handle_project_deleted(self, project_name):
         """Handle project deleted event."""
         logger.info(f"Project deleted: {project_name}")
@@ -374,26 +454,25 @@ class AppController(QObject):
             self.cleanup_current_project()
             self.main_ui.status_bar.showMessage("Ready")
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def cleanup_current_project(self):
         """Clean up the current project context."""
         if self.project_controller:
-            if self.project_controller.project_context:
-                self.project_controller.project_context.close()
+            project_context = self.project_controller.project_context
+            if project_context:
+                project_context.close()
             self.project_controller.current_project = None
             self.project_controller.project_context = None
             self.project_context = None
             self.ui_controller.reset_ui()
 
-    @handle_exception
-    @log_method
     def manage_exclusions(self, *args):
-        if self.project_controller and self.project_controller.project_context:
+        project_context = self._project_context()
+        if project_context:
             exclusions_manager_ui = self.ui_controller.manage_exclusions(
-                self.project_controller.project_context.settings_manager
+                project_context.settings_manager
             )
-            self.ui_components.append(exclusions_manager_ui)
+            self._track_ui(exclusions_manager_ui)
         else:
             logger.error("No project context available.")
             QMessageBox.warning(
@@ -402,13 +481,12 @@ class AppController(QObject):
                 "No project is currently loaded. Please load a project first.",
             )
 
-    @handle_exception
-    @log_method
     def view_directory_tree(self, *args):
-        if self.project_controller and self.project_controller.project_context:
-            result = self.project_controller.project_context.get_directory_tree()
+        project_context = self._project_context()
+        if project_context:
+            result = project_context.get_directory_tree()
             directory_tree_ui = self.ui_controller.view_directory_tree(result)
-            self.ui_components.append(directory_tree_ui)
+            self._track_ui(directory_tree_ui)
         else:
             logger.error("Cannot view directory tree: project_context is None.")
             QMessageBox.warning(
@@ -417,14 +495,14 @@ class AppController(QObject):
                 "No project is currently loaded. Please load a project first.",
             )
 
-    @handle_exception
-    @log_method
     def analyze_directory(self, *args):
-        if self.project_controller and self.project_controller.project_context:
+        project_context = self._project_context()
+        if project_context:
             result_ui = self.ui_controller.show_result(
-                self.project_controller.project_context.directory_analyzer
+                project_context.directory_analyzer
             )
             if result_ui is not None:
+                self._track_ui(result_ui)
                 result_ui.update_result()
             else:
                 logger.error("ResultUI could not be initialized.")
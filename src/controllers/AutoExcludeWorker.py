@@ -1,5 +1,4 @@
 import logging
-import traceback
 
 from PyQt5.QtCore import QObject, pyqtSignal
 
@@ -58,6 +57,6 @@ class AutoExcludeWorker(QObject):
             )
 
     def _handle_error(self, exception):
-        error_msg = f"Error in auto-exclusion analysis: {str(exception)}"
-        logger.error(f"{error_msg}\n{traceback.format_exc()}")
-        return error_msg
+        # Let the logging handlers format the traceback, and only if they emit
+        logger.error("Error in auto-exclusion analysis: %s", exception, exc_info=True)
+        return f"Error in auto-exclusion analysis: {str(exception)}"
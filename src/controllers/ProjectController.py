@@ -18,8 +18,7 @@ from typing import Any, Dict, Optional
 from models.Project import Project
 from services.ProjectContext import ProjectContext
 from services.ProjectManager import ProjectManager
-from utilities.error_handler import handle_exception
-from utilities.logging_decorator import log_method
+from utilities.error_handler import log_and_handle_exception
 
 logger = logging.getLogger(__name__)
 
@@ -51,8 +50,7 @@ class ProjectController:
         self.current_project: Optional[Project] = None
         self.project_context: Optional[ProjectContext] = None
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def create_project(self, project: Project) -> bool:
         """
         Create a new project and initialize its context.
@@ -77,8 +75,7 @@ class ProjectController:
             self._cleanup_current_project()
             raise
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def load_project(self, project_name: str) -> Optional[Project]:
         """
         Load an existing project and initialize its context.
@@ -111,8 +108,7 @@ class ProjectController:
             self._cleanup_current_project()
             raise
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def _transition_to_project(self, project: Project) -> None:
         """
         Handle transition to a new project with proper cleanup and initialization.
@@ -149,8 +145,7 @@ class ProjectController:
             self._cleanup_current_project()
             raise
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def _cleanup_current_project(self) -> None:
         """
         Clean up resources for the current project.
@@ -194,8 +189,7 @@ class ProjectController:
             self.current_project = None
             raise
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def get_theme_preference(self) -> str:
         """
         Get the current theme preference.
@@ -207,8 +201,7 @@ class ProjectController:
             return self.project_context.get_theme_preference()
         return "light"
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def set_theme_preference(self, theme: str) -> None:
         """
         Set the theme preference and save settings.
@@ -219,8 +212,7 @@ class ProjectController:
         if self.project_context:
             self.project_context.set_theme_preference(theme)
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def analyze_directory(self) -> None:
         """
         Trigger directory analysis for the current project.
@@ -233,8 +225,7 @@ class ProjectController:
         else:
             logger.error("Cannot analyze directory: project_context is None.")
 
-    @handle_exception
-    @log_method
+    @log_and_handle_exception
     def view_directory_tree(self) -> None:
         """
         Trigger view of directory structure for the current project.
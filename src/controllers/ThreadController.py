@@ -23,17 +23,19 @@ logger = logging.getLogger(__name__)
 class WorkerFinishedEvent(QEvent):
     EventType = QEvent.Type(QEvent.User + 1)
 
-    def __init__(self, result):
+    def __init__(self, result, worker=None):
         super().__init__(WorkerFinishedEvent.EventType)
         self.result = result
+        self.worker = worker
 
 
 class WorkerErrorEvent(QEvent):
     EventType = QEvent.Type(QEvent.User + 2)
 
-    def __init__(self, error):
+    def __init__(self, error, worker=None):
         super().__init__(WorkerErrorEvent.EventType)
         self.error = error
+        self.worker = worker
 
 
 class WorkerSignals(QObject):
@@ -121,6 +123,8 @@ class ThreadController(QObject):
         super().__init__()
         self.threadpool = QThreadPool()
         self.active_workers = []
+        # The runnable whose result is being re-emitted, like QObject.sender()
+        self.reporting_worker = None
         self._mutex = QMutex(QMutex.Recursive)  # Changed to recursive mutex
         self.moveToThread(QCoreApplication.instance().thread())
         QTimer.singleShot(0, self._process_events)
@@ -138,7 +142,7 @@ class ThreadController(QObject):
 
             def finished_handler(result):
                 with QMutexLocker(self._mutex):
-                    event = WorkerFinishedEvent(result)
+                    event = WorkerFinishedEvent(result, worker)
                     QCoreApplication.instance().postEvent(
                         self, event, Qt.HighEventPriority
                     )
@@ -146,7 +150,7 @@ class ThreadController(QObject):
 
             def error_handler(error):
                 with QMutexLocker(self._mutex):
-                    event = WorkerErrorEvent(error)
+                    event = WorkerErrorEvent(error, worker)
                     QCoreApplication.instance().postEvent(
                         self, event, Qt.HighEventPriority
                     )
@@ -181,23 +185,35 @@ class ThreadController(QObject):
 
     def _handle_worker_finished(self, event):
         with QMutexLocker(self._mutex):
+            self.reporting_worker = event.worker
             try:
                 self.worker_finished.emit(event.result)
             finally:
-                self._cleanup_workers()
+                self.reporting_worker = None
+                # Other workers are still running and must be able to report
+                self._cleanup_workers(self._reported_workers(event))
                 self._process_events()
 
     def _handle_worker_error(self, event):
         with QMutexLocker(self._mutex):
+            self.reporting_worker = event.worker
             try:
                 self.worker_error.emit(event.error)
             finally:
-                self._cleanup_workers()
+                self.reporting_worker = None
+                self._cleanup_workers(self._reported_workers(event))
                 self._process_events()
 
-    def _cleanup_workers(self):
+    @staticmethod
+    def _reported_workers(event):
+        return [event.worker] if event.worker is not None else None
+
+    def _cleanup_workers(self, workers=None):
+        """Disconnect and forget the given workers, or all active ones"""
         with QMutexLocker(self._mutex):
-            for worker in self.active_workers[:]:
+            if workers is None:
+                workers = self.active_workers[:]
+            for worker in workers:
                 try:
                     if hasattr(worker.signals, "cleanup"):
                         worker.signals.cleanup.emit()
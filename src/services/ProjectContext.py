@@ -220,8 +220,9 @@ class ProjectContext:
         if not self.settings_manager:
             raise RuntimeError("SettingsManager not initialized")
 
-        self.settings_manager.set_theme_preference(theme)
-        self.save_settings()
+        with self.settings_manager.batch():
+            self.settings_manager.set_theme_preference(theme)
+            self.save_settings()
 
     @property
     def is_initialized(self) -> bool:
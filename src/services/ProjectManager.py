@@ -5,7 +5,7 @@ It manages creating, loading, and saving projects, as well as maintaining projec
 import json
 import logging
 import os
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
 from models.Project import Project
 
@@ -25,6 +25,8 @@ class ProjectManager:
         """
         # Always try to create directory
         os.makedirs(self.projects_dir, exist_ok=True)
+        # (directory mtime in ns, project names) from the last listing
+        self._projects_cache: Optional[Tuple[int, List[str]]] = None
 
     def save_project(self, project: Project) -> None:
         """
@@ -40,6 +42,7 @@ class ProjectManager:
         try:
             with open(project_file, "w") as f:
                 json.dump(project.to_dict(), f, indent=4)
+            self._projects_cache = None
         except (PermissionError, OSError) as e:
             logger.error(f"Failed to save project {project.name}: {e}")
             raise
@@ -70,16 +73,24 @@ class ProjectManager:
         """
         List all saved projects.
 
+        The listing is cached and only rescanned when the projects
+        directory's modification time changes.
+
         Returns:
             List of project names
         """
         try:
+            mtime = os.stat(self.projects_dir).st_mtime_ns
+            if self._projects_cache and self._projects_cache[0] == mtime:
+                return list(self._projects_cache[1])
+
             projects = []
             for filename in os.listdir(self.projects_dir):
                 if filename.endswith(".json"):
                     project_name = filename[:-5]
                     projects.append(project_name)
-            return projects
+            self._projects_cache = (mtime, projects)
+            return list(projects)
         except (PermissionError, OSError) as e:
             logger.error(f"Failed to list projects: {e}")
             return []
@@ -98,6 +109,7 @@ class ProjectManager:
         try:
             if os.path.exists(project_file):
                 os.remove(project_file)
+                self._projects_cache = None
                 return True
             return False
         except (PermissionError, OSError) as e:
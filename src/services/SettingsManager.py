@@ -2,7 +2,8 @@ import fnmatch
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional, Set
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from models.Project import Project
 from services.ExclusionAggregator import ExclusionAggregator
@@ -25,6 +26,9 @@ class SettingsManager:
             self.config_dir, "projects", f"{self.project.name}.json"
         )
         self.exclusion_aggregator = ExclusionAggregator()
+        self._batch_depth = 0
+        self._save_pending = False
+        self._exclusion_indexes: Dict[str, Tuple[List[str], Set[str]]] = {}
         self.settings = self.load_settings()
 
     def load_settings(self) -> Dict[str, Any]:
@@ -111,8 +115,31 @@ class SettingsManager:
                     self.settings[key] = value
         self.save_settings()
 
+    @contextmanager
+    def batch(self):
+        """
+        Defer saving until the outermost batch exits.
+
+        Any number of updates and saves inside the block result in a single
+        write to disk when it exits.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._save_pending:
+                self._save_pending = False
+                self._write_settings()
+
     def save_settings(self):
-        """Save current settings to file."""
+        """Save current settings to file, or defer it while batching."""
+        if self._batch_depth:
+            self._save_pending = True
+            return
+        self._write_settings()
+
+    def _write_settings(self):
         os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
         with open(self.config_path, "w") as file:
             json.dump(self.settings, file, indent=4)
@@ -256,68 +283,66 @@ class SettingsManager:
         except ValueError:
             return path
 
+    def _exclusion_index(self, key: str) -> Set[str]:
+        """
+        Get a membership set for an exclusion list, built once per list.
+
+        The stored list is normalized and de-duplicated in place the first
+        time, so later adds and removes keep list and set in step without
+        rebuilding either. A list replaced via update_settings or direct
+        assignment is detected and re-indexed.
+        """
+        entries = self.settings.get(key)
+        cached = self._exclusion_indexes.get(key)
+        if cached is not None and cached[0] is entries:
+            return cached[1]
+
+        entries = list(dict.fromkeys(os.path.normpath(p) for p in entries or []))
+        self.settings[key] = entries
+        index = set(entries)
+        self._exclusion_indexes[key] = (entries, index)
+        return index
+
+    def _add_exclusion(self, key: str, path: str) -> bool:
+        normalized = os.path.normpath(path)
+        index = self._exclusion_index(key)
+        if normalized in index:
+            return False
+        index.add(normalized)
+        self.settings[key].append(normalized)
+        self.save_settings()
+        return True
+
+    def _remove_exclusion(self, key: str, path: str) -> bool:
+        normalized = os.path.normpath(path)
+        index = self._exclusion_index(key)
+        if normalized not in index:
+            return False
+        index.remove(normalized)
+        self.settings[key].remove(normalized)
+        self.save_settings()
+        return True
+
     def add_excluded_dir(self, directory: str) -> bool:
         """Add directory to excluded_dirs."""
-        normalized = os.path.normpath(directory)
-        current_dirs = set(self.get_excluded_dirs())
-        if normalized not in current_dirs:
-            current_dirs.add(normalized)
-            self.settings["excluded_dirs"] = list(current_dirs)
-            self.save_settings()
-            return True
-        return False
+        return self._add_exclusion("excluded_dirs", directory)
 
     def add_excluded_file(self, file: str) -> bool:
         """Add file to excluded_files."""
-        normalized = os.path.normpath(file)
-        current_files = set(self.get_excluded_files())
-        if normalized not in current_files:
-            current_files.add(normalized)
-            self.settings["excluded_files"] = list(current_files)
-            self.save_settings()
-            return True
-        return False
+        return self._add_exclusion("excluded_files", file)
 
     def remove_excluded_dir(self, directory: str) -> bool:
         """Remove directory from excluded_dirs."""
-        normalized = os.path.normpath(directory)
-        current_dirs = set(self.get_excluded_dirs())
-        if normalized in current_dirs:
-            current_dirs.remove(normalized)
-            self.settings["excluded_dirs"] = list(current_dirs)
-            self.save_settings()
-            return True
-        return False
+        return self._remove_exclusion("excluded_dirs", directory)
 
     def remove_excluded_file(self, file: str) -> bool:
         """Remove file from excluded_files."""
-        normalized = os.path.normpath(file)
-        current_files = set(self.get_excluded_files())
-        if normalized in current_files:
-            current_files.remove(normalized)
-            self.settings["excluded_files"] = list(current_files)
-            self.save_settings()
-            return True
-        return False
+        return self._remove_exclusion("excluded_files", file)
 
     def add_root_exclusion(self, exclusion: str) -> bool:
         """Add root exclusion."""
-        normalized = os.path.normpath(exclusion)
-        current_exclusions = set(self.get_root_exclusions())
-        if normalized not in current_exclusions:
-            current_exclusions.add(normalized)
-            self.settings["root_exclusions"] = list(current_exclusions)
-            self.save_settings()
-            return True
-        return False
+        return self._add_exclusion("root_exclusions", exclusion)
 
     def remove_root_exclusion(self, exclusion: str) -> bool:
         """Remove root exclusion."""
-        normalized = os.path.normpath(exclusion)
-        current_exclusions = set(self.get_root_exclusions())
-        if normalized in current_exclusions:
-            current_exclusions.remove(normalized)
-            self.settings["root_exclusions"] = list(current_exclusions)
-            self.save_settings()
-            return True
-        return False
+        return self._remove_exclusion("root_exclusions", exclusion)
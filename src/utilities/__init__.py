@@ -1,14 +1,18 @@
 """Utilities package for GynTree."""
 
 from .resource_path import ResourcePathManager, get_resource_path
+from .icons import get_app_icon, get_icon
 from .theme_manager import ThemeManager
-from .error_handler import handle_exception
+from .error_handler import handle_exception, log_and_handle_exception
 from .logging_decorator import log_method
 
 __all__ = [
     'ResourcePathManager',
     'get_resource_path',
+    'get_app_icon',
+    'get_icon',
     'ThemeManager',
     'handle_exception',
+    'log_and_handle_exception',
     'log_method'
 ]
\ No newline at end of file
@@ -51,5 +51,27 @@ def handle_exception(func):
     return wrapper
 
 
+def log_and_handle_exception(func):
+    """Decorator combining log_method and handle_exception in a single wrapper"""
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Entering %s", func.__name__)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            logger.exception(f"Exception in {func.__name__}: {str(e)}")
+            error_msg = f"An error occurred in {func.__name__}:\n{str(e)}"
+            QMessageBox.critical(None, "Error", error_msg)
+            return None
+        if debug:
+            logger.debug("Exiting %s", func.__name__)
+        return result
+
+    return wrapper
+
+
 error_handler = ErrorHandler()
 sys.excepthook = ErrorHandler.global_exception_handler
@@ -0,0 +1,34 @@
+"""
+Shared application icons.
+Icons are decoded on first use and reused by every window afterwards.
+"""
+
+from functools import lru_cache
+
+from PyQt5.QtGui import QIcon
+
+from utilities.resource_path import get_resource_path
+
+
+@lru_cache(maxsize=None)
+def get_icon(relative_path: str) -> QIcon:
+    """
+    Get an icon from the bundled resources, loading each file only once.
+
+    Args:
+        relative_path: Resource path such as "assets/images/file_icon.png"
+
+    Returns:
+        QIcon: Shared icon instance for the path
+    """
+    return QIcon(get_resource_path(relative_path))
+
+
+def get_app_icon() -> QIcon:
+    """
+    Get the GynTree window icon.
+
+    Returns:
+        QIcon: Icon loaded from assets/images/GynTree_logo.ico
+    """
+    return get_icon("assets/images/GynTree_logo.ico")
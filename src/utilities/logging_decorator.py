@@ -7,13 +7,17 @@ logger = logging.getLogger(__name__)
 def log_method(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        logger.debug(f"Entering {func.__name__}")
+        # Skip building trace messages entirely unless DEBUG is on
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            logger.debug("Entering %s", func.__name__)
         try:
             result = func(*args, **kwargs)
-            logger.debug(f"Exiting {func.__name__}")
-            return result
         except Exception as e:
             logger.exception(f"Exception in {func.__name__}: {str(e)}")
             raise
+        if debug:
+            logger.debug("Exiting %s", func.__name__)
+        return result
 
     return wrapper
@@ -5,6 +5,7 @@ Handles both development and production (PyInstaller) environments.
 
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -79,9 +80,11 @@ class ResourcePathManager:
 # Global instance
 _manager = ResourcePathManager()
 
+@lru_cache(maxsize=None)
 def get_resource_path(relative_path: str) -> str:
     """
     Global function to get resource path.
+    Resolved paths are cached; missing resources are not.
     
     Args:
         relative_path: Path relative to either src or root directory
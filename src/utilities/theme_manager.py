@@ -47,6 +47,9 @@ class ThemeManager(QObject):
         stylesheet = (
             self.light_theme if self.current_theme == "light" else self.dark_theme
         )
+        if window.styleSheet() == stylesheet:
+            # Re-setting an identical stylesheet still reparses and repolishes
+            return
         window.setStyleSheet(stylesheet)
         window.update()
         window.repaint()
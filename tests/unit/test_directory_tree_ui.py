@@ -181,6 +181,84 @@ def test_update_tree(directory_tree_ui, qtbot):
     assert first_item.childCount() == 2
 
 
+@pytest.mark.timeout(30)
+def test_update_tree_deep_structure(directory_tree_ui, qtbot):
+    """Test tree update with nesting deeper than the recursion limit"""
+    import sys
+
+    depth = sys.getrecursionlimit() + 100
+    test_structure = {"name": "leaf.py", "type": "file"}
+    for i in range(depth):
+        test_structure = {
+            "name": f"dir_{i}",
+            "type": "directory",
+            "children": [test_structure],
+        }
+
+    directory_tree_ui.update_tree(test_structure)
+    qtbot.wait(100)
+
+    item = directory_tree_ui.tree_widget.invisibleRootItem().child(0)
+    levels = 0
+    while item.childCount():
+        item = item.child(0)
+        levels += 1
+    assert levels == depth
+    assert item.text(0) == "leaf.py"
+
+
+def test_update_tree_without_icons(directory_tree_ui, qtbot):
+    """Test tree update skips icons when they failed to load"""
+    directory_tree_ui._icons_ok = False
+    test_structure = {
+        "name": "root",
+        "type": "directory",
+        "children": [{"name": "test_file.py", "type": "file"}],
+    }
+
+    directory_tree_ui.update_tree(test_structure)
+
+    root = directory_tree_ui.tree_widget.invisibleRootItem().child(0)
+    assert root.icon(0).isNull()
+    assert root.child(0).icon(0).isNull()
+
+
+def test_update_tree_skips_malformed_nodes(directory_tree_ui):
+    """Test a malformed node drops only its own subtree"""
+    test_structure = {
+        "name": "root",
+        "type": "directory",
+        "children": [
+            {"name": "before.py", "type": "file"},
+            {"type": "directory", "children": [{"name": "lost.py", "type": "file"}]},
+            {"name": 42, "type": "file"},
+            "not a node",
+            {
+                "name": "after",
+                "type": "directory",
+                "children": [{"name": "kept.py", "type": "file"}],
+            },
+        ],
+    }
+
+    directory_tree_ui.update_tree(test_structure)
+
+    root = directory_tree_ui.tree_widget.invisibleRootItem().child(0)
+    names = [root.child(i).text(0) for i in range(root.childCount())]
+    assert names == ["before.py", "after"]
+    assert root.child(1).child(0).text(0) == "kept.py"
+
+
+def test_update_tree_restores_view_state(directory_tree_ui):
+    """Test bulk population restores repaint and row shading settings"""
+    directory_tree_ui.update_tree({"name": "root", "type": "directory"})
+
+    tree = directory_tree_ui.tree_widget
+    assert tree.updatesEnabled()
+    assert tree.alternatingRowColors()
+    assert not tree.signalsBlocked()
+
+
 @pytest.mark.timeout(30)
 def test_export_functions(directory_tree_ui, qtbot, mocker, tmp_path):
     """Test export functionality with proper mocking and file handling"""
@@ -450,9 +528,13 @@ def test_performance(directory_tree_ui, qtbot):
                 {
                     "name": f"subdir_{i}",
                     "type": "directory",
-                    "children": []
-                    if depth == 1
-                    else create_large_structure(depth - 1, files_per_dir)["children"],
+                    "children": (
+                        []
+                        if depth == 1
+                        else create_large_structure(depth - 1, files_per_dir)[
+                            "children"
+                        ]
+                    ),
                 }
                 for i in range(3)
             ],
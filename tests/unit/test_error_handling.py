@@ -1,16 +1,18 @@
 import os
+import threading
 import time
 from unittest.mock import MagicMock, Mock, call, patch
 
 import pytest
 from PyQt5.QtCore import Qt
-from PyQt5.QtWidgets import QApplication, QMessageBox
+from PyQt5.QtWidgets import QApplication, QMainWindow, QMessageBox
 
 from controllers.AppController import AppController
 from controllers.ProjectController import ProjectController
 from models.Project import Project
 from services.DirectoryAnalyzer import DirectoryAnalyzer
 from services.ProjectContext import ProjectContext
+from utilities.error_handler import log_and_handle_exception
 
 
 @pytest.fixture
@@ -96,6 +98,89 @@ class TestErrorHandling:
             time.sleep(0.5)  # Allow time for the thread to handle the error
             mock_message.assert_called_once()
 
+    def test_auto_exclude_error_dialogs_throttled(self, qtbot):
+        class _Dashboard(QMainWindow):
+            def __init__(self, controller):
+                super().__init__()
+
+            def show_dashboard(self):
+                pass
+
+        with patch("controllers.AppController.DashboardUI", _Dashboard):
+            controller = AppController()
+        worker_error = controller.thread_controller.worker_error
+
+        def modal_dialog(*args):
+            # Outlast the throttle interval while another error comes in
+            qtbot.wait(150)
+            worker_error.emit("Error while the dialog is open")
+
+        with patch(
+            "PyQt5.QtWidgets.QMessageBox.critical", side_effect=modal_dialog
+        ) as mock_message:
+            worker_error.emit("First error")
+            worker_error.emit("Error right after the dialog closed")
+            mock_message.assert_called_once()
+
+            qtbot.wait(150)
+            worker_error.emit("Later error")
+            assert mock_message.call_count == 2
+
+        controller.cleanup()
+
+    def test_superseded_auto_exclude_runs_are_dropped(self, qtbot):
+        class _Dashboard(QMainWindow):
+            def __init__(self, controller):
+                super().__init__()
+                self.shown = 0
+
+            def show_dashboard(self):
+                self.shown += 1
+
+        with patch("controllers.AppController.DashboardUI", _Dashboard):
+            controller = AppController()
+        gates = [threading.Event() for _ in range(3)]
+        outcomes = [["old"], RuntimeError("stale"), ["new"]]
+        calls = []
+
+        def trigger_auto_exclude():
+            index = len(calls)
+            calls.append(index)
+            gates[index].wait(2)
+            if isinstance(outcomes[index], Exception):
+                raise outcomes[index]
+            return outcomes[index]
+
+        project_context = Mock()
+        project_context.trigger_auto_exclude.side_effect = trigger_auto_exclude
+        manager = project_context.auto_exclude_manager
+        manager.has_new_recommendations.return_value = False
+        controller.project_controller = Mock(project_context=project_context)
+        active_workers = controller.thread_controller.active_workers
+
+        def start_run(index):
+            controller._run_auto_exclude()
+            qtbot.waitUntil(lambda: len(calls) == index + 1, timeout=2000)
+
+        with patch("PyQt5.QtWidgets.QMessageBox.critical") as mock_message:
+            start_run(0)
+            start_run(1)
+            gates[0].set()
+            qtbot.waitUntil(lambda: len(active_workers) == 1, timeout=2000)
+            assert controller.main_ui.shown == 0
+
+            start_run(2)
+            gates[1].set()
+            qtbot.waitUntil(lambda: len(active_workers) == 1, timeout=2000)
+            mock_message.assert_not_called()
+
+            gates[2].set()
+            qtbot.waitUntil(lambda: not active_workers, timeout=2000)
+            assert controller.main_ui.shown == 1
+            mock_message.assert_not_called()
+
+        controller.cleanup()
+
     def test_analyzer_stop_on_error(self, mock_settings):
         analyzer = DirectoryAnalyzer("/test/path", mock_settings)
         with patch("os.walk", side_effect=PermissionError), patch(
@@ -144,3 +229,26 @@ class TestErrorHandling:
             result = analyzer.analyze_directory()
             assert result is not None
             assert "children" in result
+
+    def test_log_and_handle_exception_returns_result(self):
+        @log_and_handle_exception
+        def succeed(value):
+            return value * 2
+
+        with patch("PyQt5.QtWidgets.QMessageBox.critical") as mock_message:
+            assert succeed(21) == 42
+            mock_message.assert_not_called()
+        assert succeed.__name__ == "succeed"
+
+    def test_log_and_handle_exception_reports_once(self):
+        @log_and_handle_exception
+        def fail():
+            raise ValueError("boom")
+
+        with patch("PyQt5.QtWidgets.QMessageBox.critical") as mock_message, patch(
+            "utilities.error_handler.logger.exception"
+        ) as mock_log:
+            assert fail() is None
+            mock_message.assert_called_once()
+            assert "boom" in mock_message.call_args[0][2]
+            mock_log.assert_called_once()
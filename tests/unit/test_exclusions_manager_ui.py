@@ -4,10 +4,11 @@ import time
 
 import psutil
 import pytest
-from PyQt5.QtCore import Qt
+from PyQt5.QtCore import QItemSelectionModel, Qt
 from PyQt5.QtTest import QTest
-from PyQt5.QtWidgets import QFileDialog, QMessageBox, QPushButton, QTreeWidget
+from PyQt5.QtWidgets import QFileDialog, QMessageBox, QPushButton, QTreeView
 
+from components.ExclusionsModel import ExclusionsModel
 from components.UI.ExclusionsManagerUI import ExclusionsManagerUI
 
 
@@ -29,6 +30,20 @@ class _TestData:
             if key in self.data:
                 self.data[key] = set(value) if isinstance(value, (list, set)) else set()
 
+    def add(self, key, value):
+        """Add a single entry, returning whether it was new"""
+        if value in self.data[key]:
+            return False
+        self.data[key].add(value)
+        return True
+
+    def remove(self, key, value):
+        """Remove a single entry, returning whether it was present"""
+        if value not in self.data[key]:
+            return False
+        self.data[key].remove(value)
+        return True
+
     def get(self, key, default=None):
         """Get data with default value"""
         return set(self.data.get(key, default or set()))
@@ -50,7 +65,19 @@ def mock_settings_manager(mocker):
         side_effect=lambda: test_data.get("root_exclusions")
     )
     mock.update_settings = mocker.Mock(side_effect=test_data.update)
+    for key, noun in (("excluded_dirs", "dir"), ("excluded_files", "file")):
+        setattr(
+            mock,
+            f"add_excluded_{noun}",
+            mocker.Mock(side_effect=lambda path, key=key: test_data.add(key, path)),
+        )
+        setattr(
+            mock,
+            f"remove_excluded_{noun}",
+            mocker.Mock(side_effect=lambda path, key=key: test_data.remove(key, path)),
+        )
     mock.save_settings = mocker.Mock(return_value=True)
+    mock.batch = mocker.MagicMock()
 
     return mock
 
@@ -102,6 +129,7 @@ def exclusions_ui(
         mock_controller, mock_theme_manager, mock_settings_manager
     )  # Use mock directly
     ui._skip_show_event = True  # Skip the show event for testing
+    ui._ensure_ui()
     qtbot.addWidget(ui)
     return ui
 
@@ -113,10 +141,52 @@ def test_initialization(exclusions_ui):
     assert exclusions_ui.root_tree is not None
 
 
+def test_widgets_built_on_first_show(
+    qtbot, mock_controller, mock_settings_manager, mock_theme_manager, mock_dialogs
+):
+    """Test widget construction is deferred until the window is shown"""
+    ui = ExclusionsManagerUI(mock_controller, mock_theme_manager, mock_settings_manager)
+    ui._skip_show_event = True
+    qtbot.addWidget(ui)
+    assert not ui._ui_built
+    assert ui.windowTitle() == "Exclusions Manager"
+    mock_theme_manager.apply_theme.assert_not_called()
+
+    ui.show()
+    tree = ui.exclusion_tree
+    assert tree is not None
+    qtbot.waitUntil(tree.isVisible)
+
+    mock_theme_manager.apply_theme.assert_called_once_with(ui)
+
+    ui.hide()
+    ui.show()
+    assert ui.exclusion_tree is tree
+    mock_theme_manager.apply_theme.assert_called_once_with(ui)
+
+
+def test_widgets_built_on_first_access(
+    qtbot, mock_controller, mock_settings_manager, mock_theme_manager, mock_dialogs
+):
+    """Test the widgets are usable before the window is ever shown"""
+    ui = ExclusionsManagerUI(mock_controller, mock_theme_manager, mock_settings_manager)
+    qtbot.addWidget(ui)
+
+    assert ui.root_tree is not None
+    assert ui._ui_built
+    assert ui.exclusion_tree.model() is ui.exclusion_model
+    mock_theme_manager.apply_theme.assert_called_once_with(ui)
+
+
 def test_tree_widgets_setup(exclusions_ui):
     """Test tree widget initialization"""
-    assert exclusions_ui.exclusion_tree.headerItem().text(0) == "Type"
-    assert exclusions_ui.exclusion_tree.headerItem().text(1) == "Path"
+    model = exclusions_ui.exclusion_tree.model()
+    assert model is exclusions_ui.exclusion_model
+    assert model.headerData(0, Qt.Horizontal) == "Type"
+    assert model.headerData(1, Qt.Horizontal) == "Path"
+    for tree in (exclusions_ui.exclusion_tree, exclusions_ui.root_tree):
+        assert tree.uniformRowHeights()
+        assert not tree.isAnimated()
 
 
 def test_add_directory(exclusions_ui, qtbot):
@@ -157,6 +227,178 @@ def test_add_file(exclusions_ui, qtbot):
     assert len(current_exclusions["excluded_files"]) == initial_count + 1
 
 
+def test_exclusions_fetched_once_per_load(exclusions_ui, qtbot):
+    """Test repeated edits reuse cached exclusions until the project reloads"""
+    settings_manager = exclusions_ui.settings_manager
+    settings_manager.get_all_exclusions.reset_mock()
+
+    model = exclusions_ui.exclusion_model
+    exclusions_ui.add_directory()
+    qtbot.waitUntil(lambda: model.excluded_dirs() == ["subfolder"])
+    exclusions_ui.add_file()
+    qtbot.waitUntil(lambda: model.excluded_files() == ["test.txt"])
+    assert settings_manager.get_all_exclusions.call_count == 1
+
+    exclusions_ui.controller.project_controller.project_context.settings_manager = (
+        settings_manager
+    )
+    exclusions_ui.load_project_data()
+    assert settings_manager.get_all_exclusions.call_count == 2
+    assert model.excluded_dirs() == ["subfolder"]
+    assert model.excluded_files() == ["test.txt"]
+
+
+def test_unchanged_exclusions_skip_rebuild(exclusions_ui, qtbot):
+    """Test repopulating with identical content leaves the trees untouched"""
+    exclusions_ui.settings_manager.update_settings(
+        {
+            "root_exclusions": {"venv"},
+            "excluded_dirs": {"alpha"},
+            "excluded_files": {"a.txt"},
+        }
+    )
+    exclusions_ui.populate_exclusion_tree()
+    exclusions_ui.populate_root_exclusions()
+
+    model = exclusions_ui.exclusion_model
+    resets = []
+    model.modelReset.connect(lambda: resets.append(True))
+    root_item = exclusions_ui.root_tree.topLevelItem(0)
+
+    exclusions_ui._invalidate_exclusions()
+    exclusions_ui.populate_exclusion_tree()
+    exclusions_ui.populate_root_exclusions()
+    assert not resets
+    assert exclusions_ui.root_tree.topLevelItem(0) is root_item
+
+    # An in-place edit makes the model differ from settings until saved
+    model.setData(model.index(0, 1, model.category_index(0)), "beta")
+    exclusions_ui.populate_exclusion_tree()
+    assert len(resets) == 1
+    assert model.excluded_dirs() == ["alpha"]
+
+
+def test_sorted_order_kept_across_edits(exclusions_ui, qtbot):
+    """Test added and removed exclusions keep the tree sorted"""
+    exclusions_ui.settings_manager.update_settings(
+        {"excluded_dirs": {"alpha", "zeta"}, "excluded_files": set()}
+    )
+    exclusions_ui.populate_exclusion_tree()
+
+    exclusions_ui.add_directory()
+    model = exclusions_ui.exclusion_model
+    qtbot.waitUntil(lambda: len(model.excluded_dirs()) == 3)
+    assert model.excluded_dirs() == ["alpha", "subfolder", "zeta"]
+
+    exclusions_ui.exclusion_tree.setCurrentIndex(
+        model.index(0, 0, model.category_index(0))
+    )
+    exclusions_ui.remove_selected()
+    assert model.excluded_dirs() == ["subfolder", "zeta"]
+
+
+def test_add_directory_resolved_off_ui_thread(exclusions_ui, qtbot, mocker):
+    """Test relative paths are computed on a pool thread"""
+    import threading
+
+    calling_threads = []
+    real_relpath = os.path.relpath
+
+    def tracking_relpath(*args):
+        calling_threads.append(threading.current_thread())
+        return real_relpath(*args)
+
+    mocker.patch("components.UI.ExclusionsManagerUI.os.path.relpath", tracking_relpath)
+
+    exclusions_ui.add_directory()
+    qtbot.waitUntil(
+        lambda: "subfolder" in exclusions_ui.exclusion_model.excluded_dirs()
+    )
+
+    assert calling_threads
+    assert threading.main_thread() not in calling_threads
+
+
+def test_pending_resolution_outlives_destroyed_window(
+    qtbot,
+    mocker,
+    mock_controller,
+    mock_settings_manager,
+    mock_theme_manager,
+    mock_dialogs,
+):
+    """Test a resolution still running when its window is destroyed is dropped"""
+    import threading
+
+    from PyQt5 import sip
+    from PyQt5.QtCore import QThreadPool
+
+    excepthook = mocker.patch("sys.excepthook")
+    release = threading.Event()
+    real_relpath = os.path.relpath
+
+    def blocked_relpath(*args):
+        release.wait(5)
+        return real_relpath(*args)
+
+    mocker.patch("components.UI.ExclusionsManagerUI.os.path.relpath", blocked_relpath)
+
+    ui = ExclusionsManagerUI(mock_controller, mock_theme_manager, mock_settings_manager)
+    ui._skip_show_event = True
+    ui.add_directory()
+    sip.delete(ui)
+
+    release.set()
+    assert QThreadPool.globalInstance().waitForDone(5000)
+    qtbot.wait(50)
+
+    excepthook.assert_not_called()
+    mock_settings_manager.add_excluded_dir.assert_not_called()
+
+
+def test_start_directory_cached_on_load(exclusions_ui):
+    """Test the project start directory is read on load and dropped on close"""
+    project_context = exclusions_ui.controller.project_controller.project_context
+    project_context.is_initialized = True
+    project_context.settings_manager = exclusions_ui.settings_manager
+    exclusions_ui.load_project_data()
+    assert exclusions_ui._get_start_directory() == "/test/project"
+
+    project_context.project.start_directory = "/other/project"
+    assert exclusions_ui._get_start_directory() == "/test/project"
+
+    exclusions_ui.close()
+    assert exclusions_ui._get_start_directory() == "/other/project"
+
+
+def test_edits_update_tree_incrementally(exclusions_ui, qtbot):
+    """Test add and remove patch single rows instead of resetting the tree"""
+    exclusions_ui.settings_manager.update_settings(
+        {"excluded_dirs": {"alpha"}, "excluded_files": {"a.txt"}}
+    )
+    exclusions_ui.populate_exclusion_tree()
+
+    model = exclusions_ui.exclusion_model
+    resets, inserts, removals = [], [], []
+    model.modelReset.connect(lambda: resets.append(True))
+    model.rowsInserted.connect(lambda parent, first, last: inserts.append(first))
+    model.rowsRemoved.connect(lambda parent, first, last: removals.append(first))
+
+    exclusions_ui.add_directory()
+    qtbot.waitUntil(lambda: len(inserts) == 1)
+    exclusions_ui.add_file()
+    qtbot.waitUntil(lambda: len(inserts) == 2)
+    dirs_index = model.category_index(0)
+    exclusions_ui.exclusion_tree.setCurrentIndex(model.index(0, 0, dirs_index))
+    exclusions_ui.remove_selected()
+
+    assert not resets
+    assert inserts == [1, 1]
+    assert removals == [0]
+    assert model.excluded_dirs() == ["subfolder"]
+    assert model.excluded_files() == ["a.txt", "test.txt"]
+
+
 def test_remove_selected(exclusions_ui, qtbot):
     """Test removing selected items"""
     # Setup test data
@@ -171,9 +413,9 @@ def test_remove_selected(exclusions_ui, qtbot):
     exclusions_ui.populate_exclusion_tree()
     qtbot.wait(100)
 
-    dirs_item = exclusions_ui.exclusion_tree.topLevelItem(0)
-    test_item = dirs_item.child(0)
-    exclusions_ui.exclusion_tree.setCurrentItem(test_item)
+    model = exclusions_ui.exclusion_model
+    test_index = model.index(0, 0, model.category_index(0))
+    exclusions_ui.exclusion_tree.setCurrentIndex(test_index)
 
     # Remove the item
     remove_btn = next(
@@ -206,14 +448,23 @@ def test_populate_trees(exclusions_ui, qtbot):
     qtbot.wait(100)
 
     # Verify structure
-    assert exclusions_ui.exclusion_tree.topLevelItemCount() == 2
-    dirs_item = exclusions_ui.exclusion_tree.topLevelItem(0)
-    files_item = exclusions_ui.exclusion_tree.topLevelItem(1)
-
-    assert dirs_item.text(0) == "Excluded Dirs"
-    assert files_item.text(0) == "Excluded Files"
-    assert dirs_item.childCount() == 2
-    assert files_item.childCount() == 2
+    model = exclusions_ui.exclusion_model
+    assert model.rowCount() == 2
+    dirs_index = model.category_index(0)
+    files_index = model.category_index(1)
+
+    assert dirs_index.data() == "Excluded Dirs"
+    assert files_index.data() == "Excluded Files"
+    assert model.rowCount(dirs_index) == 2
+    assert model.rowCount(files_index) == 2
+    assert model.index(0, 0, dirs_index).data() == "Directory"
+    assert model.index(0, 1, dirs_index).data() == "dir1"
+    assert exclusions_ui.root_tree.topLevelItemCount() == 2
+    root_item = exclusions_ui.root_tree.topLevelItem(0)
+    assert not root_item.flags() & (Qt.ItemIsSelectable | Qt.ItemIsEditable)
+    assert model.flags(dirs_index) == Qt.ItemIsEnabled
+    assert model.flags(model.index(0, 1, dirs_index)) & Qt.ItemIsEditable
+    assert not model.flags(model.index(0, 0, dirs_index)) & Qt.ItemIsEditable
 
 
 def test_save_and_exit(exclusions_ui, qtbot, mocker):
@@ -277,9 +528,32 @@ def test_large_exclusion_list(exclusions_ui, qtbot):
     end_time = time.time()
 
     assert (end_time - start_time) < 5.0
-    assert exclusions_ui.exclusion_tree.topLevelItemCount() == 2
-    dirs_item = exclusions_ui.exclusion_tree.topLevelItem(0)
-    assert dirs_item.childCount() == 1000
+    model = exclusions_ui.exclusion_model
+    assert model.rowCount() == 2
+    assert len(model.excluded_dirs()) == 1000
+    assert len(model.excluded_files()) == 1000
+
+
+def test_large_exclusion_list_fetched_lazily(exclusions_ui, qtbot):
+    """Test exclusion rows are fetched in batches rather than all at once"""
+    exclusions_ui.settings_manager.get_all_exclusions.side_effect = lambda: {
+        "root_exclusions": set(),
+        "excluded_dirs": {f"dir_{i:04d}" for i in range(2000)},
+        "excluded_files": set(),
+    }
+
+    exclusions_ui.populate_exclusion_tree()
+
+    model = exclusions_ui.exclusion_model
+    dirs_index = model.category_index(0)
+    assert model.rowCount(dirs_index) < 2000
+    assert model.rowCount(dirs_index) % ExclusionsModel.FETCH_BATCH_SIZE == 0
+    assert model.canFetchMore(dirs_index)
+
+    while model.canFetchMore(dirs_index):
+        model.fetchMore(dirs_index)
+    assert model.rowCount(dirs_index) == 2000
+    assert model.index(1999, 1, dirs_index).data() == "dir_1999"
 
 
 def test_memory_management(exclusions_ui, qtbot):
@@ -361,8 +635,8 @@ def test_relative_path_handling(exclusions_ui, qtbot):
     exclusions_ui.populate_exclusion_tree()
     qtbot.wait(100)
 
-    dirs_item = exclusions_ui.exclusion_tree.topLevelItem(0)
-    assert dirs_item.child(0).text(1) == relative_path
+    model = exclusions_ui.exclusion_model
+    assert model.index(0, 1, model.category_index(0)).data() == relative_path
 
 
 def test_rapid_operations(exclusions_ui, qtbot):
@@ -378,7 +652,7 @@ def test_rapid_operations(exclusions_ui, qtbot):
         qtbot.wait(50)
 
     qtbot.wait(200)
-    assert exclusions_ui.exclusion_tree.topLevelItemCount() > 0
+    assert exclusions_ui.exclusion_model.rowCount() > 0
 
 
 def test_invalid_project_context(exclusions_ui, qtbot):
@@ -391,7 +665,7 @@ def test_invalid_project_context(exclusions_ui, qtbot):
     qtbot.wait(100)
 
     # Verify empty trees
-    assert exclusions_ui.exclusion_tree.topLevelItemCount() == 0
+    assert exclusions_ui.exclusion_model.rowCount() == 0
     assert exclusions_ui.root_tree.topLevelItemCount() == 0
 
 
@@ -436,15 +710,18 @@ def test_remove_selected_multiple(exclusions_ui, qtbot):
     exclusions_ui.populate_exclusion_tree()
 
     # Select multiple items
-    dirs_item = exclusions_ui.exclusion_tree.topLevelItem(0)
-    files_item = exclusions_ui.exclusion_tree.topLevelItem(1)
+    model = exclusions_ui.exclusion_model
+    dirs_index = model.category_index(0)
+    files_index = model.category_index(1)
 
     # Enable multi-selection mode
-    exclusions_ui.exclusion_tree.setSelectionMode(QTreeWidget.ExtendedSelection)
+    exclusions_ui.exclusion_tree.setSelectionMode(QTreeView.ExtendedSelection)
 
     # Select items properly
-    dirs_item.child(0).setSelected(True)
-    files_item.child(0).setSelected(True)
+    selection_model = exclusions_ui.exclusion_tree.selectionModel()
+    flags = QItemSelectionModel.Select | QItemSelectionModel.Rows
+    selection_model.select(model.index(0, 0, dirs_index), flags)
+    selection_model.select(model.index(0, 0, files_index), flags)
     qtbot.wait(100)
 
     # Remove selected
@@ -495,6 +772,26 @@ def test_add_file_in_root_exclusion(exclusions_ui, qtbot, mocker):
     assert len(current_data["excluded_files"]) == 0
 
 
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("build/output.txt", True),
+        ("ab/file.txt", True),
+        ("ac/file.txt", True),
+        ("b/file.txt", False),
+        ("src/main.py", False),
+        ("", False),
+    ],
+)
+def test_root_exclusion_prefix_lookup(exclusions_ui, path, expected):
+    """Test root exclusion prefix matching against overlapping entries"""
+    exclusions_ui.settings_manager.update_settings(
+        {"root_exclusions": {"a", "ab", "build", "c"}}
+    )
+
+    assert exclusions_ui._is_under_root_exclusion(path) is expected
+
+
 def test_edit_item(exclusions_ui, qtbot):
     """Test editing an excluded item"""
     # Setup initial data
@@ -507,9 +804,8 @@ def test_edit_item(exclusions_ui, qtbot):
     exclusions_ui.populate_exclusion_tree()
 
     # Edit the item
-    dirs_item = exclusions_ui.exclusion_tree.topLevelItem(0)
-    test_item = dirs_item.child(0)
-    test_item.setText(1, "new_dir")
+    model = exclusions_ui.exclusion_model
+    assert model.setData(model.index(0, 1, model.category_index(0)), "new_dir")
 
     # Save changes
     save_btn = next(
@@ -526,6 +822,27 @@ def test_edit_item(exclusions_ui, qtbot):
     assert "dir1" not in current_data["excluded_dirs"]
 
 
+def test_edit_item_keeps_sorted_order(exclusions_ui):
+    """Test edited paths move to their sorted row and stay removable"""
+    model = exclusions_ui.exclusion_model
+    model.set_exclusions({"b", "d", "f"}, set())
+    dirs_index = model.category_index(0)
+    model.fetchMore(dirs_index)
+
+    assert model.setData(model.index(0, 1, dirs_index), "z")
+    assert model.excluded_dirs() == ["d", "f", "z"]
+    assert model.data(model.index(2, 1, dirs_index)) == "z"
+
+    # Duplicates are rejected instead of written in place
+    assert not model.setData(model.index(0, 1, dirs_index), "f")
+    assert model.excluded_dirs() == ["d", "f", "z"]
+
+    assert model.remove_path(0, "z")
+    model.add_path(0, "c")
+    assert model.excluded_dirs() == ["c", "d", "f"]
+    assert model.rowCount(dirs_index) == 3
+
+
 def test_project_context_null(exclusions_ui, qtbot):
     """Test handling of null project context"""
     # Set null project context
@@ -536,7 +853,7 @@ def test_project_context_null(exclusions_ui, qtbot):
     qtbot.wait(100)
 
     # Verify warning shown and empty trees
-    assert exclusions_ui.exclusion_tree.topLevelItemCount() == 0
+    assert exclusions_ui.exclusion_model.rowCount() == 0
     assert exclusions_ui.root_tree.topLevelItemCount() == 0
 
 
@@ -611,7 +928,7 @@ def test_remove_selected_none_selected(exclusions_ui, qtbot, mocker):
 def test_save_and_exit_null_children(exclusions_ui, qtbot):
     """Test save and exit with null tree items"""
     # Clear trees
-    exclusions_ui.exclusion_tree.clear()
+    exclusions_ui.exclusion_model.clear()
     exclusions_ui.root_tree.clear()
 
     # Try to save
@@ -152,6 +152,28 @@ class TestProjectManager:
         project_list = project_manager.list_projects()
         assert project_list == []
 
+    def test_list_projects_cached_until_directory_changes(
+        self, project_manager, sample_project, monkeypatch
+    ):
+        """Test the listing is only rescanned when the projects directory changes"""
+        project_manager.save_project(sample_project)
+        assert project_manager.list_projects() == ["test_project"]
+
+        calls = []
+        real_listdir = os.listdir
+
+        def counting_listdir(path):
+            calls.append(path)
+            return real_listdir(path)
+
+        monkeypatch.setattr(os, "listdir", counting_listdir)
+        assert project_manager.list_projects() == ["test_project"]
+        assert calls == []
+
+        project_manager.delete_project(sample_project.name)
+        assert project_manager.list_projects() == []
+        assert len(calls) == 1
+
     def test_delete_project(self, project_manager, sample_project):
         """Test deleting a project"""
         project_manager.save_project(sample_project)
@@ -55,6 +55,44 @@ def test_initialization(project_ui):
     assert project_ui.start_dir_label is not None
 
 
+def test_project_list_model(project_ui, mock_controller):
+    """Test projects are served from a string list model"""
+    assert project_ui._projects_model.stringList() == ["project1", "project2"]
+    assert project_ui.project_list.uniformItemSizes()
+
+    model_resets = []
+    project_ui._projects_model.modelReset.connect(lambda: model_resets.append(True))
+    project_ui.refresh_project_list()
+    assert not model_resets
+
+    mock_controller.project_controller.project_manager.list_projects.return_value = [
+        "project3"
+    ]
+    project_ui.refresh_project_list()
+    assert project_ui._projects_model.stringList() == ["project3"]
+
+
+def test_project_list_patched_in_place(project_ui, mock_controller):
+    """Test a refresh only inserts and removes the changed rows"""
+    model = project_ui._projects_model
+    inserted, removed, resets = [], [], []
+    model.rowsInserted.connect(lambda _, first, last: inserted.append((first, last)))
+    model.rowsRemoved.connect(lambda _, first, last: removed.append((first, last)))
+    model.modelReset.connect(lambda: resets.append(True))
+
+    list_projects = mock_controller.project_controller.project_manager.list_projects
+    list_projects.return_value = ["project0", "project1", "project2"]
+    project_ui.refresh_project_list()
+    assert model.stringList() == ["project0", "project1", "project2"]
+    assert inserted == [(0, 0)]
+
+    list_projects.return_value = ["project0", "project2"]
+    project_ui.refresh_project_list()
+    assert model.stringList() == ["project0", "project2"]
+    assert removed == [(1, 1)]
+    assert not resets
+
+
 def test_ui_components(project_ui):
     """Test presence and properties of UI components"""
     # Test main section frames
@@ -128,7 +166,7 @@ def test_create_project_success(project_ui, qtbot, tmp_path):
 def test_load_project(project_ui, qtbot):
     """Test project loading"""
     # Select project from list
-    project_ui.project_list.setCurrentRow(0)
+    project_ui.project_list.setCurrentIndex(project_ui._projects_model.index(0))
 
     # Watch for signal
     with qtbot.waitSignal(project_ui.project_loaded, timeout=1000) as blocker:
@@ -267,7 +305,7 @@ def test_concurrent_operations(project_ui, qtbot, tmp_path, mocker):
         QTest.mouseClick(project_ui.start_dir_button, Qt.LeftButton)
         project_ui.project_name_input.setText(f"test_project_{i}")
         QTest.mouseClick(project_ui.create_project_btn, Qt.LeftButton)
-        project_ui.project_list.setCurrentRow(0)
+        project_ui.project_list.setCurrentIndex(project_ui._projects_model.index(0))
         QTest.mouseClick(project_ui.load_project_btn, Qt.LeftButton)
         qtbot.wait(10)
 
@@ -303,6 +341,24 @@ def test_directory_access_error(project_ui, qtbot, tmp_path, mocker):
     )
 
 
+def test_validate_directory_single_stat(project_ui, tmp_path, mocker):
+    """Test directory validation results and that each check stats once"""
+    stat_spy = mocker.spy(os, "stat")
+    file_path = tmp_path / "file.txt"
+    file_path.write_text("")
+
+    assert project_ui.validate_directory(str(tmp_path)) == (True, "")
+    assert project_ui.validate_directory(str(file_path)) == (
+        False,
+        "Selected path is not a directory",
+    )
+    assert project_ui.validate_directory(str(file_path / "child")) == (
+        False,
+        "Selected directory does not exist",
+    )
+    assert stat_spy.call_count == 3
+
+
 @pytest.mark.timeout(30)
 def test_file_operation_error(project_ui, qtbot, tmp_path, mocker):
     """Test file operation error handling"""
@@ -311,7 +367,7 @@ def test_file_operation_error(project_ui, qtbot, tmp_path, mocker):
     mocker.patch("os.path.exists", return_value=True)  # Add this
     mocker.patch("os.path.isdir", return_value=True)  # Add this
     mocker.patch("os.access", return_value=True)  # Add this
-    mocker.patch("pathlib.Path.exists", side_effect=PermissionError("Access denied"))
+    mocker.patch("os.stat", side_effect=PermissionError("Access denied"))
 
     project_ui.project_name_input.setText("test_project")
     project_ui.start_dir_label.setText(str(tmp_path))
@@ -326,12 +382,35 @@ def test_file_operation_error(project_ui, qtbot, tmp_path, mocker):
 
 @pytest.mark.timeout(30)
 def test_close_event_handler(project_ui, qtbot):
-    """Test close event handling"""
+    """Test closing hides the window for reuse until the app shuts down"""
+    event = QCloseEvent()
+    project_ui.closeEvent(event)
+    assert not event.isAccepted()
+    assert project_ui.isHidden()
+
+    project_ui.show()
+    assert project_ui.isVisible()
+
+    project_ui.shutdown()
+    assert project_ui.isHidden()
     event = QCloseEvent()
     project_ui.closeEvent(event)
     assert event.isAccepted()
 
 
+def test_reset_inputs(project_ui):
+    """Test reset_inputs clears what a previous use left in the form"""
+    project_ui.project_name_input.setText("leftover")
+    project_ui.start_dir_label.setText("/some/dir")
+    project_ui.project_list.setCurrentIndex(project_ui._projects_model.index(0))
+
+    project_ui.reset_inputs()
+
+    assert project_ui.project_name_input.text() == ""
+    assert project_ui.start_dir_label.text() == "No directory selected"
+    assert not project_ui.project_list.selectionModel().hasSelection()
+
+
 @pytest.mark.timeout(30)
 def test_invalid_directory_path(project_ui, qtbot, mocker):
     """Test handling of invalid directory paths"""
@@ -1,23 +1,26 @@
 import gc
 import logging
+import os
+import threading
 import time
 from pathlib import Path
 from typing import Any, Dict, List
 
 import psutil
 import pytest
-from PyQt5.QtCore import QPoint, QSize, Qt, QTimer
+from PyQt5 import sip
+from PyQt5.QtCore import QPoint, QSize, Qt, QThreadPool, QTimer
 from PyQt5.QtGui import QFont
 from PyQt5.QtTest import QTest
 from PyQt5.QtWidgets import (
+    QAbstractItemView,
     QApplication,
     QHeaderView,
     QLabel,
     QMainWindow,
     QMessageBox,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QVBoxLayout,
 )
 
@@ -116,7 +119,7 @@ def test_initialization(result_ui, helper):
     assert isinstance(result_ui, QMainWindow)
     assert result_ui.windowTitle() == "Analysis Results"
     assert result_ui.result_table is not None
-    assert result_ui.result_data is None
+    assert result_ui.result_model.rowCount() == 0
 
     helper.check_memory_usage("initialization")
 
@@ -135,7 +138,7 @@ def test_ui_components(result_ui, qtbot, helper):
 
     # Test buttons
     buttons = result_ui.findChildren(QPushButton)
-    button_texts = {"Copy to Clipboard", "Save as TXT", "Save as CSV"}
+    button_texts = {"Fit Columns", "Copy to Clipboard", "Save as TXT", "Save as CSV"}
     assert {btn.text() for btn in buttons} == button_texts
 
     helper.check_memory_usage("UI components")
@@ -147,11 +150,18 @@ def test_table_setup(result_ui, helper):
     helper.track_memory()
 
     table = result_ui.result_table
-    assert table.columnCount() == 2
-    assert table.horizontalHeader().sectionResizeMode(1) == QHeaderView.Stretch
+    assert table.model() is result_ui.result_model
+    assert table.model().columnCount() == 2
+    assert table.model().headerData(0, Qt.Horizontal) == "Path"
+    assert table.model().headerData(1, Qt.Horizontal) == "Description"
+    assert table.horizontalHeader().sectionResizeMode(0) == QHeaderView.Interactive
+    assert table.horizontalHeader().sectionResizeMode(1) == QHeaderView.Fixed
     assert not table.verticalHeader().isVisible()
-    assert table.wordWrap() is True
+    assert table.wordWrap() is False
+    assert table.verticalHeader().sectionResizeMode(0) == QHeaderView.Fixed
     assert table.showGrid() is True
+    assert not table.alternatingRowColors()
+    assert table.verticalScrollMode() == QAbstractItemView.ScrollPerPixel
 
     helper.check_memory_usage("table setup")
 
@@ -164,14 +174,52 @@ def test_update_result(result_ui, qtbot, helper):
     with qtbot.waitSignal(result_ui.resultUpdated, timeout=1000):
         result_ui.update_result()
 
-    table = result_ui.result_table
-    assert table.rowCount() == len(helper.test_data)
-    assert table.item(0, 0).text() == "/test/file1.py"
-    assert table.item(0, 1).text() == "Test file 1 description"
+    model = result_ui.result_table.model()
+    assert model.rowCount() == len(helper.test_data)
+    assert model.index(0, 0).data() == "/test/file1.py"
+    assert model.index(0, 1).data() == "Test file 1 description"
 
     helper.check_memory_usage("update result")
 
 
+def test_update_result_stores_columns(result_ui, helper):
+    """Test results are kept as path and description columns"""
+    result_ui.update_result()
+
+    model = result_ui.result_model
+    assert model.paths() == [item["path"] for item in helper.test_data]
+    assert model.descriptions() == [item["description"] for item in helper.test_data]
+
+
+def test_refresh_display_reuses_loaded_results(result_ui, mock_directory_analyzer):
+    """Test refreshing after a load does not re-scan the directory"""
+    result_ui.refresh_display()
+    assert mock_directory_analyzer.get_flat_structure.call_count == 1
+
+    result_ui.refresh_display()
+    assert mock_directory_analyzer.get_flat_structure.call_count == 1
+    assert result_ui.result_model.rowCount() > 0
+
+    result_ui.update_result()
+    assert mock_directory_analyzer.get_flat_structure.call_count == 2
+
+
+@pytest.mark.timeout(30)
+def test_update_result_skips_row_measurement(result_ui, qtbot, mocker):
+    """Test rows keep the fixed height instead of being measured"""
+    resize_spy = mocker.spy(result_ui.result_table, "resizeRowsToContents")
+    default_height = result_ui.result_table.verticalHeader().defaultSectionSize()
+
+    result_ui.update_result()
+    qtbot.wait(50)
+
+    assert resize_spy.call_count == 0
+    assert result_ui.result_table.rowHeight(0) == default_height
+    assert result_ui.result_table.columnWidth(0) > 50
+    index = result_ui.result_model.index(0, 1)
+    assert index.data(Qt.ToolTipRole) == index.data()
+
+
 @pytest.mark.timeout(30)
 def test_copy_to_clipboard(result_ui, qtbot, mocker, helper):
     """Test copying results to clipboard"""
@@ -189,31 +237,41 @@ def test_copy_to_clipboard(result_ui, qtbot, mocker, helper):
     with qtbot.waitSignal(result_ui.clipboardCopyComplete, timeout=1000):
         QTest.mouseClick(copy_btn, Qt.LeftButton)
 
-    mock_clipboard.return_value.setText.assert_called_once()
-    clipboard_text = mock_clipboard.return_value.setText.call_args[0][0]
+    mock_clipboard.return_value.setMimeData.assert_called_once()
+    mime_data = mock_clipboard.return_value.setMimeData.call_args[0][0]
+    clipboard_text = mime_data.text()
+    assert bytes(mime_data.data("text/csv")).decode("utf-8") == clipboard_text
     assert "Path,Description" in clipboard_text
+    assert "/test/file1.py,Test file 1 description" in clipboard_text
 
     helper.check_memory_usage("clipboard copy")
 
 
 @pytest.mark.timeout(30)
-def test_save_csv(result_ui, qtbot, mocker, helper):
-    """Test saving results as CSV"""
-    helper.track_memory()
+def test_copy_to_clipboard_quotes_fields(result_ui, mocker, mock_directory_analyzer):
+    """Test clipboard CSV quotes fields containing commas and quotes"""
+    mock_clipboard = mocker.patch.object(QApplication, "clipboard")
+    mock_directory_analyzer.get_flat_structure.return_value = [
+        {"path": "/test/a,b.py", "description": 'Says "hi"'},
+    ]
+    result_ui.update_result()
+    result_ui.copy_to_clipboard()
 
-    # Create mock temp file object
-    mock_temp_file = mocker.Mock()
-    mock_temp_file.name = "/tmp/test.csv"
-    mock_temp = mocker.patch("tempfile.NamedTemporaryFile", return_value=mock_temp_file)
+    mime_data = mock_clipboard.return_value.setMimeData.call_args[0][0]
+    assert mime_data.text() == 'Path,Description\n"/test/a,b.py","Says ""hi"""\n'
 
-    # Setup file mock
-    mock_file = mocker.mock_open()
-    open_mock = mocker.patch("builtins.open", mock_file)
-    mocker.patch("os.path.exists", return_value=False)
-    mocker.patch("shutil.copy2")
+
+@pytest.mark.timeout(30)
+def test_save_csv(result_ui, qtbot, mocker, helper, tmp_path):
+    """Test saving results as CSV renames a sibling temp file into place"""
+    helper.track_memory()
+
+    export_dir = tmp_path / "exports"
+    output = export_dir / "output.csv"
+    replace_spy = mocker.spy(os, "replace")
     mocker.patch(
         "PyQt5.QtWidgets.QFileDialog.getSaveFileName",
-        return_value=("/test/output.csv", ""),
+        return_value=(str(output), ""),
     )
 
     result_ui.update_result()
@@ -226,14 +284,122 @@ def test_save_csv(result_ui, qtbot, mocker, helper):
     with qtbot.waitSignal(result_ui.saveComplete, timeout=1000):
         QTest.mouseClick(save_csv_btn, Qt.LeftButton)
 
-    # Verify temp file was created and written to
-    mock_temp.assert_called_once()
-    calls = open_mock.mock_calls
-    assert len(calls) > 0
+    # The temp file lives beside the target and is renamed, not copied
+    replace_spy.assert_called_once()
+    temp_name, target = replace_spy.call_args[0]
+    assert os.path.dirname(temp_name) == str(export_dir)
+    assert target == str(output)
+    assert [path.name for path in export_dir.iterdir()] == ["output.csv"]
 
     helper.check_memory_usage("save CSV")
 
 
+@pytest.mark.timeout(30)
+@pytest.mark.parametrize(
+    "file_type, expected",
+    [
+        (
+            "txt",
+            "/test/file1.py: Test file 1 description\n"
+            "/test/file2.py: Test file 2 description\n",
+        ),
+        (
+            "csv",
+            "Path,Description\r\n"
+            "/test/file1.py,Test file 1 description\r\n"
+            "/test/file2.py,Test file 2 description\r\n",
+        ),
+    ],
+)
+def test_save_file_contents(result_ui, qtbot, mocker, tmp_path, file_type, expected):
+    """Test exported files contain every result row"""
+    output = tmp_path / f"output.{file_type}"
+    mocker.patch(
+        "PyQt5.QtWidgets.QFileDialog.getSaveFileName",
+        return_value=(str(output), ""),
+    )
+    result_ui.update_result()
+
+    with qtbot.waitSignal(result_ui.saveComplete, timeout=1000):
+        result_ui.save_file(file_type)
+
+    assert output.read_bytes().decode("utf-8") == expected
+
+
+@pytest.mark.timeout(30)
+def test_save_file_error_reported(result_ui, qtbot, mocker, tmp_path):
+    """Test a failed background export reports the error"""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("")
+    mocker.patch(
+        "PyQt5.QtWidgets.QFileDialog.getSaveFileName",
+        return_value=(str(blocker / "output.txt"), ""),
+    )
+    result_ui.update_result()
+
+    with qtbot.waitSignal(result_ui.error, timeout=1000) as error:
+        result_ui.save_file("txt")
+
+    assert error.args[0].startswith("Failed to save file")
+
+
+@pytest.mark.timeout(30)
+def test_save_file_failed_rename_removes_temp(result_ui, qtbot, mocker, tmp_path):
+    """Test a rename that keeps failing leaves neither target nor temp file"""
+    export_dir = tmp_path / "exports"
+    mocker.patch(
+        "PyQt5.QtWidgets.QFileDialog.getSaveFileName",
+        return_value=(str(export_dir / "output.txt"), ""),
+    )
+    mocker.patch("os.replace", side_effect=PermissionError("locked"))
+    result_ui._retry_delay = 0
+    result_ui.update_result()
+
+    with qtbot.waitSignal(result_ui.error, timeout=1000):
+        result_ui.save_file("txt")
+
+    qtbot.waitUntil(lambda: not any(export_dir.iterdir()))
+    assert os.replace.call_count == result_ui._max_retries
+
+
+@pytest.mark.timeout(30)
+def test_save_file_outlives_destroyed_window(
+    qtbot,
+    mocker,
+    mock_controller,
+    mock_theme_manager,
+    mock_directory_analyzer,
+    tmp_path,
+):
+    """Test an export still running when its window is destroyed finishes quietly"""
+    output = tmp_path / "output.txt"
+    mocker.patch(
+        "PyQt5.QtWidgets.QFileDialog.getSaveFileName",
+        return_value=(str(output), ""),
+    )
+    excepthook = mocker.patch("sys.excepthook")
+    release = threading.Event()
+    real_replace = os.replace
+
+    def blocked_replace(*args):
+        release.wait(5)
+        return real_replace(*args)
+
+    mocker.patch("os.replace", side_effect=blocked_replace)
+
+    ui = ResultUI(mock_controller, mock_theme_manager, mock_directory_analyzer)
+    ui.update_result()
+    ui.save_file("txt")
+    sip.delete(ui)
+
+    release.set()
+    assert QThreadPool.globalInstance().waitForDone(5000)
+    qtbot.wait(50)
+
+    assert output.exists()
+    excepthook.assert_not_called()
+
+
 @pytest.mark.timeout(30)
 def test_error_handling(result_ui, qtbot, mocker, helper):
     """Test error handling in save operations"""
@@ -277,11 +443,32 @@ def test_large_dataset(result_ui, qtbot, mock_directory_analyzer, helper):
     duration = time.time() - start_time
 
     assert duration < 2.0  # Should complete within 2 seconds
-    assert result_ui.result_table.rowCount() == 1000
+    assert result_ui.result_model.rowCount() == 1000
 
     helper.check_memory_usage("large dataset")
 
 
+def test_path_width_samples_longest_paths_for_huge_results(
+    result_ui, mock_directory_analyzer, mocker
+):
+    """Test huge results measure only a sample of the longest paths"""
+    mocker.patch("components.UI.ResultUI._MAX_MEASURED_ROWS", 2)
+    mocker.patch("components.UI.ResultUI._MEASURED_SAMPLE_SIZE", 2)
+    mock_directory_analyzer.get_flat_structure.return_value = [
+        {"path": "/a", "description": ""},
+        {"path": "/a/much/longer/path.py", "description": ""},
+        {"path": "/WWWWWWWWWW", "description": ""},
+    ]
+    result_ui.update_result()
+
+    widths = {"/a/much/longer/path.py": 120, "/WWWWWWWWWW": 150}
+    font_metrics = mocker.Mock()
+    font_metrics.horizontalAdvance.side_effect = widths.__getitem__
+    assert result_ui._path_column_width(font_metrics) == 150
+    measured = {call.args[0] for call in font_metrics.horizontalAdvance.call_args_list}
+    assert measured == set(widths)
+
+
 @pytest.mark.timeout(30)
 def test_window_resize(result_ui, qtbot, helper):
     """Test window resize handling"""
@@ -302,6 +489,23 @@ def test_window_resize(result_ui, qtbot, helper):
     helper.check_memory_usage("window resize")
 
 
+@pytest.mark.timeout(30)
+def test_resize_burst_adjusts_columns_once(result_ui, qtbot, mocker):
+    """Test a burst of resize events leads to a single column adjustment"""
+    adjust_spy = mocker.spy(result_ui, "adjust_column_widths")
+    result_ui._resize_timer.timeout.disconnect()
+    result_ui._resize_timer.timeout.connect(result_ui.adjust_column_widths)
+
+    size = result_ui.size()
+    for step in range(1, 6):
+        result_ui.resize(size.width() + step * 10, size.height())
+    assert adjust_spy.call_count == 0
+
+    qtbot.waitUntil(lambda: adjust_spy.call_count == 1)
+    qtbot.wait(50)
+    assert adjust_spy.call_count == 1
+
+
 @pytest.mark.timeout(30)
 def test_rapid_updates(result_ui, qtbot, helper):
     """Test UI stability during rapid updates"""
@@ -312,7 +516,7 @@ def test_rapid_updates(result_ui, qtbot, helper):
         result_ui.update_result()
         qtbot.wait(10)  # Minimal wait to simulate rapid updates
 
-    assert result_ui.result_table.rowCount() > 0
+    assert result_ui.result_model.rowCount() > 0
     assert result_ui.result_table.isVisible()
 
     helper.check_memory_usage("rapid updates")
@@ -332,10 +536,9 @@ def test_sort_functionality(result_ui, qtbot, helper):
     qtbot.wait(100)
 
     # Verify sorting
-    first_item = result_ui.result_table.item(0, 0).text()
-    last_item = result_ui.result_table.item(
-        result_ui.result_table.rowCount() - 1, 0
-    ).text()
+    model = result_ui.result_table.model()
+    first_item = model.index(0, 0).data()
+    last_item = model.index(model.rowCount() - 1, 0).data()
     assert first_item <= last_item
 
     helper.check_memory_usage("sort functionality")
@@ -364,8 +567,7 @@ def test_memory_cleanup(result_ui, qtbot, helper):
         gc.collect()
 
     # Clear table
-    result_ui.result_table.clear()
-    result_ui.result_data = None
+    result_ui.result_model.clear()
     gc.collect()
 
     final_memory = psutil.Process().memory_info().rss
@@ -443,12 +645,12 @@ def test_table_selection(result_ui, qtbot, helper):
     result_ui.update_result()
 
     # Select some items
-    result_ui.result_table.setSelectionMode(QTableWidget.MultiSelection)
+    result_ui.result_table.setSelectionMode(QTableView.MultiSelection)
     result_ui.result_table.selectRow(0)
     qtbot.wait(100)
 
-    selected_items = result_ui.result_table.selectedItems()
-    assert len(selected_items) > 0
+    selected_rows = result_ui.result_table.selectionModel().selectedRows()
+    assert [index.data() for index in selected_rows] == ["/test/file1.py"]
 
     helper.check_memory_usage("table selection")
 
@@ -470,5 +672,20 @@ def test_column_resize(result_ui, qtbot, helper):
     helper.check_memory_usage("column resize")
 
 
+def test_fit_columns(result_ui, qtbot):
+    """Test fitting sizes the path column once and restores fixed modes"""
+    result_ui.update_result()
+    table = result_ui.result_table
+    table.setColumnWidth(0, 5)
+
+    result_ui.fit_columns()
+
+    header = table.horizontalHeader()
+    assert table.columnWidth(0) > 5
+    assert header.sectionResizeMode(0) == QHeaderView.Interactive
+    assert header.sectionResizeMode(1) == QHeaderView.Fixed
+    assert table.columnWidth(0) + table.columnWidth(1) == table.viewport().width()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -240,6 +240,44 @@ def test_save_settings(settings_manager, helper):
     helper.check_memory_usage("save settings")
 
 
+@pytest.mark.timeout(30)
+def test_batch_saves_once(settings_manager, mocker):
+    """Test batched updates are written to disk once on exit"""
+    write_spy = mocker.spy(settings_manager, "_write_settings")
+
+    with settings_manager.batch():
+        settings_manager.update_settings({"excluded_dirs": ["batched_dir"]})
+        with settings_manager.batch():
+            settings_manager.add_excluded_file("batched_file.txt")
+        settings_manager.save_settings()
+        assert write_spy.call_count == 0
+
+    assert write_spy.call_count == 1
+    new_manager = SettingsManager(settings_manager.project)
+    assert "batched_dir" in new_manager.get_excluded_dirs()
+    assert "batched_file.txt" in new_manager.get_excluded_files()
+
+
+@pytest.mark.timeout(30)
+def test_exclusion_updates_in_place(settings_manager):
+    """Test single adds and removes mutate the stored list without rebuilding it"""
+    settings_manager.update_settings({"excluded_dirs": ["a", "b//c", "a"]})
+    assert settings_manager.add_excluded_dir("d")
+    stored = settings_manager.settings["excluded_dirs"]
+    assert stored == ["a", os.path.normpath("b/c"), "d"]
+
+    assert not settings_manager.add_excluded_dir("b/c")
+    assert settings_manager.remove_excluded_dir("a")
+    assert not settings_manager.remove_excluded_dir("a")
+    assert settings_manager.settings["excluded_dirs"] is stored
+    assert stored == [os.path.normpath("b/c"), "d"]
+
+    # Replacing the list through update_settings re-indexes it
+    settings_manager.update_settings({"excluded_dirs": ["x"]})
+    assert settings_manager.add_excluded_dir("d")
+    assert settings_manager.get_excluded_dirs() == ["x", "d"]
+
+
 @pytest.mark.timeout(30)
 def test_is_excluded(settings_manager, helper):
     """Test path exclusion checking"""
@@ -143,6 +143,21 @@ def test_apply_theme(theme_manager, app, helper):
     helper.check_memory_usage("apply theme")
 
 
+@pytest.mark.timeout(30)
+def test_apply_same_theme_skips_restyle(theme_manager, app, helper, mocker):
+    """Test re-applying the current theme leaves the widget's stylesheet alone"""
+    test_widget = helper.create_test_widget()
+    theme_manager.apply_theme(test_widget)
+
+    set_style = mocker.spy(test_widget, "setStyleSheet")
+    theme_manager.apply_theme(test_widget)
+    set_style.assert_not_called()
+
+    theme_manager.toggle_theme()
+    theme_manager.apply_theme(test_widget)
+    set_style.assert_called_once()
+
+
 @pytest.mark.timeout(30)
 def test_apply_theme_to_all_windows(theme_manager, app, helper):
     """Test theme application to multiple windows"""
@@ -313,3 +313,31 @@ def test_cleanup_during_error(thread_controller, mock_project_context, qtbot):
 
     qtbot.waitUntil(check_error, timeout=2000)
     assert len(thread_controller.active_workers) == 0
+
+
+@pytest.mark.timeout(5)
+def test_overlapping_workers_each_report(thread_controller, qtbot):
+    releases = [threading.Event(), threading.Event()]
+    contexts = []
+    for index, release in enumerate(releases):
+        context = Mock()
+        context.trigger_auto_exclude.side_effect = (
+            lambda release=release, index=index: release.wait(2) and [f"run{index}"]
+        )
+        contexts.append(context)
+
+    reporters = []
+    thread_controller.worker_finished.connect(
+        lambda result: reporters.append((thread_controller.reporting_worker, result))
+    )
+    workers = [thread_controller.start_auto_exclude_thread(c) for c in contexts]
+
+    releases[0].set()
+    qtbot.waitUntil(lambda: len(reporters) == 1, timeout=2000)
+    assert workers[1] in thread_controller.active_workers
+
+    releases[1].set()
+    qtbot.waitUntil(lambda: len(reporters) == 2, timeout=2000)
+    assert reporters == [(workers[0], ["run0"]), (workers[1], ["run1"])]
+    assert thread_controller.reporting_worker is None
+    assert len(thread_controller.active_workers) == 0